@@ -19,6 +19,8 @@ Examples:
     python main.py dashboard    # Open dashboard (HTML file)
 """
 
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -29,19 +31,32 @@ SRC_DIR = ROOT_DIR / "src"
 sys.path.insert(0, str(SRC_DIR))
 
 
+def _exec_tool(tool: str, *args: str):
+    """Replace this process with an installed command-line tool.
+
+    The launcher has nothing left to do once the tool starts, so exec'ing
+    avoids keeping an idle Python parent alive alongside it.
+    """
+    executable = shutil.which(tool)
+    if not executable:
+        sys.exit(f"❌ {tool} not installed. Run: pip install {tool}")
+    sys.stdout.flush()
+    os.execv(executable, [executable, *args])
+
+
 def run_app():
     """Start the Streamlit research chat interface."""
     print("🌊 Starting GroundwaterGPT Research Interface...")
-    subprocess.run(
-        ["streamlit", "run", str(SRC_DIR / "ui" / "research_chat.py"), "--server.port", "8502"]
+    _exec_tool(
+        "streamlit", "run", str(SRC_DIR / "ui" / "research_chat.py"), "--server.port", "8502"
     )
 
 
 def run_viz():
     """Start the integrated visualization app with research + charts."""
     print("📊 Starting GroundwaterGPT Integrated App (Research + Visualization)...")
-    subprocess.run(
-        ["streamlit", "run", str(SRC_DIR / "ui" / "integrated_app.py"), "--server.port", "8501"]
+    _exec_tool(
+        "streamlit", "run", str(SRC_DIR / "ui" / "integrated_app.py"), "--server.port", "8501"
     )
 
 
@@ -76,7 +91,7 @@ def run_train():
 def run_tests():
     """Run the test suite."""
     print("🧪 Running tests...")
-    subprocess.run(["pytest", "tests/", "-v"])
+    _exec_tool("pytest", "tests/", "-v")
 
 
 def show_help():
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+USGS CSV to Parquet Conversion Script
+
+Writes a zstd-compressed Parquet copy next to every downloaded USGS CSV
+(data/usgs_*.csv -> data/usgs_*.parquet). Parquet files are typed and
+columnar, so scripts that only need a few columns (e.g.
+verify_usgs_data.py) read them much faster than re-parsing the CSV.
+
+Usage:
+    python3 scripts/convert_usgs_to_parquet.py
+
+Requires pyarrow. Up-to-date Parquet files are skipped; a CSV that is
+newer than its Parquet copy is converted again.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+
+
+def convert(csv_path: Path) -> Path | None:
+    """Convert one CSV to Parquet, returning the new path (None if up to date)."""
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return None
+
+    df = pd.read_csv(csv_path)
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=False)
+    return parquet_path
+
+
+def main():
+    csv_files = sorted(DATA_DIR.glob("usgs_*.csv"))
+    if not csv_files:
+        print(f"⚠️  No USGS CSV files found in {DATA_DIR}")
+        return 1
+
+    converted = 0
+    for csv_path in csv_files:
+        parquet_path = convert(csv_path)
+        if parquet_path is None:
+            print(f"   {csv_path.name}: up to date")
+            continue
+        converted += 1
+        ratio = parquet_path.stat().st_size / max(csv_path.stat().st_size, 1)
+        print(f"✅ {csv_path.name} -> {parquet_path.name} ({ratio:.0%} of CSV size)")
+
+    print(f"\nConverted {converted} of {len(csv_files)} files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,42 +16,97 @@ What it checks:
     - Aquifer types are correct
 """
 
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-import pandas as pd
+from src.agent.knowledge import search_usgs_data  # noqa: E402
+
+# Parquet copies (scripts/convert_usgs_to_parquet.py) are read when pyarrow is available
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Numeric tokens in KB text (site IDs, record counts, stats like "3.50").
+# A minus sign only counts when it does not follow a word character, so
+# "2014-2023" and "USGS-02290000" yield positive numbers.
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?")
 
-from src.agent.knowledge import search_usgs_data
+# Parsed CSVs keyed by resolved path; each file is read once per run
+_CSV_CACHE: dict[Path, pd.DataFrame] = {}
+
+
+def _parquet_copy(csv_path: Path) -> Path | None:
+    """Return the Parquet copy of a CSV if it is readable and not stale."""
+    parquet_path = csv_path.with_suffix(".parquet")
+    if not PYARROW_AVAILABLE or not parquet_path.exists():
+        return None
+    if csv_path.exists() and parquet_path.stat().st_mtime < csv_path.stat().st_mtime:
+        return None
+    return parquet_path
+
+
+def _load(csv_file) -> pd.DataFrame:
+    """Load the columns used for verification from a USGS CSV, cached.
+
+    Prefers the Parquet copy of the file when one is present.
+    """
+    path = Path(csv_file).resolve()
+    if path not in _CSV_CACHE:
+        parquet_path = _parquet_copy(path)
+        if parquet_path is not None:
+            df = pd.read_parquet(parquet_path, columns=["value", "site_no"], engine="pyarrow")
+        else:
+            df = pd.read_csv(path, usecols=["value", "site_no"])
+        _CSV_CACHE[path] = df
+    return _CSV_CACHE[path]
 
 
 def verify_site(csv_file: str, site_name: str) -> dict:
     """Verify a single site's data matches between CSV and KB."""
     # Load CSV
-    df = pd.read_csv(csv_file)
+    df = _load(csv_file)
 
-    # Calculate statistics from CSV
+    # Calculate statistics from CSV on the raw array (NaNs skipped, as pandas does)
+    values = df["value"].to_numpy(dtype=float)
+    values = values[~np.isnan(values)]
+    if values.size:
+        mean, low, high = (round(float(v), 2) for v in (values.mean(), values.min(), values.max()))
+    else:
+        # No readings: NaN stats, as pandas gives, instead of a zero-size reduction error
+        mean = low = high = float("nan")
     csv_stats = {
-        "mean": round(df["value"].mean(), 2),
-        "min": round(df["value"].min(), 2),
-        "max": round(df["value"].max(), 2),
+        "mean": mean,
+        "min": low,
+        "max": high,
         "records": len(df),
-        "site_id": str(df["site_no"].iloc[0]),
+        "site_id": str(df["site_no"].iat[0]) if len(df) else "",
     }
 
     # Get KB data
     results = search_usgs_data(site_name=site_name, k=5)
-    kb_content = " ".join([r.page_content for r in results])
+    kb_numbers = set()
+    for r in results:
+        kb_numbers.update(_NUMBER_RE.findall(r.page_content))
 
-    # Check matches
+    # Check matches (KB summaries format stats with two decimals)
     matches = {
-        "mean": str(csv_stats["mean"]) in kb_content,
-        "records": str(csv_stats["records"]) in kb_content,
-        "site_id": csv_stats["site_id"] in kb_content,
+        "mean": f"{csv_stats['mean']:.2f}" in kb_numbers,
+        "records": str(csv_stats["records"]) in kb_numbers,
+        "site_id": csv_stats["site_id"] in kb_numbers,
     }
 
     return {
@@ -62,12 +117,34 @@ def verify_site(csv_file: str, site_name: str) -> dict:
     }
 
 
+def _verify_one(site: tuple) -> dict | None:
+    """Verify one (csv_path, site_name) pair; None if its data file is missing."""
+    csv_path, site_name = site
+    if not os.path.isfile(csv_path) and _parquet_copy(csv_path) is None:
+        return None
+    return verify_site(str(csv_path), site_name)
+
+
+def _print_result(result: dict):
+    """Print one site's verification result as a single block."""
+    stats = result["csv_stats"]
+    status = "✅" if result["all_match"] else "❌"
+    print(
+        f"{status} {result['site_name']}\n"
+        f"   Site ID: {stats['site_id']}\n"
+        f"   CSV Stats: Mean={stats['mean']}ft, Records={stats['records']}, "
+        f"Range=[{stats['min']}, {stats['max']}]\n"
+        f"   KB Match: {result['matches']}\n",
+        flush=True,
+    )
+
+
 def main():
-    print("=" * 70)
-    print("🔬 USGS DATA VERIFICATION")
-    print("   Comparing Knowledge Base data to raw USGS CSV files")
-    print("=" * 70)
-    print()
+    rule = "=" * 70
+    sys.stdout.write(
+        f"{rule}\n🔬 USGS DATA VERIFICATION\n"
+        f"   Comparing Knowledge Base data to raw USGS CSV files\n{rule}\n\n"
+    )
 
     # Define all sites to verify
     sites = [
@@ -80,46 +157,46 @@ def main():
     ]
 
     all_verified = True
-
-    for csv_file, site_name in sites:
-        csv_path = PROJECT_ROOT / csv_file
-
-        if not csv_path.exists():
-            print(f"⚠️  CSV not found: {csv_file}")
-            continue
-
-        result = verify_site(str(csv_path), site_name)
-
-        status = "✅" if result["all_match"] else "❌"
-        all_verified = all_verified and result["all_match"]
-
-        print(f"{status} {site_name}")
-        print(f"   Site ID: {result['csv_stats']['site_id']}")
-        print(
-            f"   CSV Stats: Mean={result['csv_stats']['mean']}ft, "
-            f"Records={result['csv_stats']['records']}, "
-            f"Range=[{result['csv_stats']['min']}, {result['csv_stats']['max']}]"
-        )
-        print(f"   KB Match: {result['matches']}")
-        print()
-
-    print("=" * 70)
+    resolved = [(PROJECT_ROOT / csv_file, site_name) for csv_file, site_name in sites]
+    site_ids = {}
+
+    # Sites are independent (CSV read + KB search), so verify them concurrently.
+    # Threads share the parsed-CSV cache and the process's embedding setup;
+    # each result is printed as soon as its site finishes.
+    with ThreadPoolExecutor(max_workers=min(len(sites), os.cpu_count() or 1)) as pool:
+        futures = {
+            pool.submit(_verify_one, site): csv_file for site, (csv_file, _) in zip(resolved, sites)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            if result is None:
+                print(f"⚠️  CSV not found: {futures[future]}", flush=True)
+                continue
+            all_verified = all_verified and result["all_match"]
+            site_ids[result["site_name"]] = result["csv_stats"]["site_id"]
+            _print_result(result)
+
+    # Summary and manual-check URLs go out as one buffered write
+    report = [rule]
     if all_verified:
-        print("✅ VERIFICATION PASSED: All KB data matches USGS source data!")
+        report.append("✅ VERIFICATION PASSED: All KB data matches USGS source data!")
     else:
-        print("❌ VERIFICATION FAILED: Some data does not match")
-    print("=" * 70)
-
-    # Additional: Show how to verify against live USGS website
-    print()
-    print("📌 To manually verify against USGS website:")
-    print("   Visit: https://waterdata.usgs.gov/nwis/gwlevels?site_no=<SITE_ID>")
-    print()
-    print("   Example URLs:")
-    for csv_file, site_name in sites[:2]:
-        df = pd.read_csv(PROJECT_ROOT / csv_file)
-        site_id = df["site_no"].iloc[0]
-        print(f"   - {site_name}: https://waterdata.usgs.gov/nwis/gwlevels?site_no={site_id}")
+        report.append("❌ VERIFICATION FAILED: Some data does not match")
+    report += [
+        rule,
+        "",
+        "📌 To manually verify against USGS website:",
+        "   Visit: https://waterdata.usgs.gov/nwis/gwlevels?site_no=<SITE_ID>",
+        "",
+        "   Example URLs:",
+    ]
+    for _, site_name in sites[:2]:
+        site_id = site_ids.get(site_name)
+        if site_id is not None:
+            report.append(
+                f"   - {site_name}: https://waterdata.usgs.gov/nwis/gwlevels?site_no={site_id}"
+            )
+    sys.stdout.write("\n".join(report) + "\n")
 
     return 0 if all_verified else 1
 
@@ -9,15 +9,25 @@ Agentic RAG system combining:
 Uses LangGraph for modern, reliable agent architecture.
 """
 
+import re
+import time
+from collections import deque
+from functools import cached_property
 from typing import Generator, List, Optional
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.tools import tool
-from langgraph.prebuilt import create_react_agent
 
 from .knowledge import get_knowledge_stats, search_knowledge
 from .llm_factory import LLMProvider, get_llm
-from .tools import GROUNDWATER_TOOLS
+from .tools import (
+    GROUNDWATER_TOOLS,
+    analyze_seasonal_patterns,
+    detect_anomalies,
+    get_data_quality_report,
+    get_water_level_prediction,
+    query_groundwater_data,
+)
 
 # System prompt for the agent
 SYSTEM_PROMPT = """You are GroundwaterGPT, an expert AI assistant specializing in groundwater hydrology and water resources.
@@ -58,6 +68,37 @@ You have access to hydrogeology reference documents including:
 - Use emojis sparingly for visual organization (📊, 💧, 📅, etc.)
 """
 
+# Intent keywords, checked in priority order. Keywords match at the start of a
+# word, so "predict" also covers "prediction" and "anomal" covers "anomaly".
+_INTENT_TABLE = (
+    ("prediction", ("predict", "forecast", "future", "next")),
+    ("seasonal", ("season", "wet", "dry", "pattern")),
+    ("anomaly", ("anomal", "unusual", "outlier", "extreme")),
+    ("quality", ("quality", "coverage", "missing", "gap")),
+)
+_KNOWLEDGE_PHRASES = ("what is", "define", "explain", "term", "meaning", "glossary")
+_WORD_RE = re.compile(r"\w+")
+
+# Fixed pieces of the simple-chat turn, pre-joined once:
+# context + parts[0] + user message + parts[1]
+_QUESTION_HEADER = "\n\n---\n\nUser Question: "
+_RESPONSE_REQUEST = (
+    "\n\nPlease provide a helpful, accurate response based on the data and context above."
+)
+_ANSWER_PROMPT_PARTS = (
+    _QUESTION_HEADER,
+    _RESPONSE_REQUEST + "\nUse the specific numbers and statistics from the context."
+    "\nBe concise but thorough.",
+)
+_STREAM_PROMPT_PARTS = (_QUESTION_HEADER, _RESPONSE_REQUEST)
+
+# Conversation turns (user + assistant message pairs) kept in chat history
+MAX_TURNS = 8
+
+# Seconds a tool result stays in the per-agent context cache. The USGS data
+# behind the tools does not change within a chat session.
+CONTEXT_CACHE_TTL = 300
+
 
 @tool
 def search_hydrogeology_docs(query: str) -> str:
@@ -75,21 +116,17 @@ def search_hydrogeology_docs(query: str) -> str:
     if not docs:
         return "No relevant documents found in the knowledge base."
 
-    result = "📚 **Relevant Knowledge Base Results:**\n\n"
+    parts = ["📚 **Relevant Knowledge Base Results:**\n\n"]
     for i, doc in enumerate(docs, 1):
         source = doc.metadata.get("source_file", "Unknown")
         page = doc.metadata.get("page", "?")
-        score = doc.metadata.get("similarity_score", 0)
 
         # Truncate content if too long
-        content = (
-            doc.page_content[:500] + "..." if len(doc.page_content) > 500 else doc.page_content
-        )
+        content = doc.page_content[:500] + ("..." if len(doc.page_content) > 500 else "")
 
-        result += f"**Source {i}:** {source} (page {page})\n"
-        result += f"{content}\n\n"
+        parts.append(f"**Source {i}:** {source} (page {page})\n{content}\n\n")
 
-    return result
+    return "".join(parts)
 
 
 class GroundwaterAgent:
@@ -108,6 +145,7 @@ class GroundwaterAgent:
         temperature: float = 0.7,
         verbose: bool = False,
         use_react: bool = False,  # Set True for larger models
+        max_turns: int = MAX_TURNS,
     ):
         """
         Initialize the Groundwater Agent.
@@ -118,6 +156,7 @@ class GroundwaterAgent:
             temperature: Response temperature
             verbose: Enable verbose output
             use_react: Use ReAct agent (better for GPT-4/Claude/Gemini)
+            max_turns: Recent turns kept as history; older ones are dropped
         """
         self.llm = get_llm(provider=provider, model=model, temperature=temperature)
         self.verbose = verbose
@@ -125,9 +164,31 @@ class GroundwaterAgent:
 
         # Combine all tools
         self.tools = GROUNDWATER_TOOLS + [search_hydrogeology_docs]
-        self.tools_dict = {tool.name: tool for tool in self.tools}
+
+        # Context sources for simple chat: (section header, tool, tool input).
+        # The data summary grounds every answer; the rest are added per intent.
+        self._summary_tool = ("Current Data", query_groundwater_data, {"stat_type": "summary"})
+        self._intent_tools = {
+            "prediction": ("Prediction", get_water_level_prediction, {}),
+            "seasonal": ("Seasonal Analysis", analyze_seasonal_patterns, {}),
+            "anomaly": ("Anomaly Detection", detect_anomalies, {}),
+            "quality": ("Data Quality", get_data_quality_report, {}),
+        }
+
+        # Tool results by section header: header -> (timestamp, result)
+        self._context_cache: dict = {}
+        self._knowledge_info: Optional[tuple] = None  # (timestamp, stats)
+
+        # The system prompt never changes, so it is sent as one reusable
+        # SystemMessage (providers can cache it) rather than re-concatenated
+        # into every turn's prompt
+        self._system_message = SystemMessage(content=SYSTEM_PROMPT)
 
         if use_react:
+            # LangGraph is only needed for ReAct; importing it lazily keeps
+            # simple-chat and knowledge-only imports of this module light
+            from langgraph.prebuilt import create_react_agent
+
             # Create the LangGraph ReAct agent for larger models
             self.agent = create_react_agent(
                 model=self.llm,
@@ -137,87 +198,47 @@ class GroundwaterAgent:
         else:
             self.agent = None
 
-        # Chat history
-        self.chat_history: List = []
+        # Chat history, bounded so the ReAct prompt does not grow every turn
+        self.chat_history: deque = deque(maxlen=2 * max_turns)
 
     def _detect_intent(self, message: str) -> str:
         """Detect user intent to select appropriate tool."""
         message_lower = message.lower()
+        tokens = set(_WORD_RE.findall(message_lower))
 
-        if any(word in message_lower for word in ["predict", "forecast", "future", "next"]):
-            return "prediction"
-        elif any(word in message_lower for word in ["season", "wet", "dry", "pattern"]):
-            return "seasonal"
-        elif any(word in message_lower for word in ["anomal", "unusual", "outlier", "extreme"]):
-            return "anomaly"
-        elif any(word in message_lower for word in ["quality", "coverage", "missing", "gap"]):
-            return "quality"
-        elif any(
-            word in message_lower
-            for word in ["what is", "define", "explain", "term", "meaning", "glossary"]
-        ):
+        for intent, keywords in _INTENT_TABLE:
+            if any(token.startswith(keywords) for token in tokens):
+                return intent
+
+        if any(phrase in message_lower for phrase in _KNOWLEDGE_PHRASES):
             return "knowledge"
-        else:
-            return "data"
+        return "data"
 
     def _get_context(self, message: str, intent: str) -> str:
         """Get relevant context based on intent."""
         context_parts = []
 
-        # Always add data summary for grounding
-        try:
-            from .tools import query_groundwater_data
-
-            data_summary = query_groundwater_data.invoke({"stat_type": "summary"})
-            context_parts.append(f"## Current Data:\n{data_summary}")
-        except Exception as e:
-            if self.verbose:
-                print(f"Error getting data: {e}")
-
-        # Add specific context based on intent
-        if intent == "prediction":
-            try:
-                from .tools import get_water_level_prediction
-
-                prediction = get_water_level_prediction.invoke({})
-                context_parts.append(f"## Prediction:\n{prediction}")
-            except Exception as e:
-                if self.verbose:
-                    print(f"Error getting prediction: {e}")
-
-        elif intent == "seasonal":
-            try:
-                from .tools import analyze_seasonal_patterns
-
-                seasonal = analyze_seasonal_patterns.invoke({})
-                context_parts.append(f"## Seasonal Analysis:\n{seasonal}")
-            except Exception as e:
-                if self.verbose:
-                    print(f"Error getting seasonal: {e}")
-
-        elif intent == "anomaly":
-            try:
-                from .tools import detect_anomalies
-
-                anomalies = detect_anomalies.invoke({})
-                context_parts.append(f"## Anomaly Detection:\n{anomalies}")
-            except Exception as e:
-                if self.verbose:
-                    print(f"Error getting anomalies: {e}")
+        sources = [self._summary_tool]
+        if intent in self._intent_tools:
+            sources.append(self._intent_tools[intent])
 
-        elif intent == "quality":
+        now = time.monotonic()
+        for header, context_tool, tool_input in sources:
+            cached = self._context_cache.get(header)
+            if cached and now - cached[0] < CONTEXT_CACHE_TTL:
+                context_parts.append(f"## {header}:\n{cached[1]}")
+                continue
             try:
-                from .tools import get_data_quality_report
-
-                quality = get_data_quality_report.invoke({})
-                context_parts.append(f"## Data Quality:\n{quality}")
+                result = context_tool.invoke(tool_input)
+                self._context_cache[header] = (now, result)
+                context_parts.append(f"## {header}:\n{result}")
             except Exception as e:
                 if self.verbose:
-                    print(f"Error getting quality: {e}")
+                    print(f"Error getting {header.lower()}: {e}")
 
-        elif intent == "knowledge":
+        if intent == "knowledge":
             try:
-                docs = search_knowledge(message, k=3)
+                docs = search_knowledge(message, k=3, score_threshold=0.5)
                 if docs:
                     context_parts.append("## Knowledge Base:\n")
                     for i, doc in enumerate(docs, 1):
@@ -231,6 +252,11 @@ class GroundwaterAgent:
 
         return "\n\n".join(context_parts)
 
+    def _build_messages(self, message: str, context: str, parts: tuple) -> list:
+        """Build the simple-chat input: fixed system message + this turn's context."""
+        turn = context + parts[0] + message + parts[1]
+        return [self._system_message, HumanMessage(content=turn)]
+
     def chat(self, message: str) -> str:
         """
         Send a message and get a response.
@@ -248,7 +274,8 @@ class GroundwaterAgent:
 
     def _chat_react(self, message: str) -> str:
         """Use ReAct agent for tool calling (larger models)."""
-        messages = self.chat_history + [HumanMessage(content=message)]
+        messages = list(self.chat_history)
+        messages.append(HumanMessage(content=message))
         result = self.agent.invoke({"messages": messages})
 
         response_messages = result.get("messages", [])
@@ -273,21 +300,8 @@ class GroundwaterAgent:
         intent = self._detect_intent(message)
         context = self._get_context(message, intent)
 
-        # Build the prompt with context
-        prompt = f"""{SYSTEM_PROMPT}
-
-{context}
-
----
-
-User Question: {message}
-
-Please provide a helpful, accurate response based on the data and context above.
-Use the specific numbers and statistics from the context.
-Be concise but thorough."""
-
         # Generate response
-        response = self.llm.invoke(prompt)
+        response = self.llm.invoke(self._build_messages(message, context, _ANSWER_PROMPT_PARTS))
 
         # Update history
         self.chat_history.append(HumanMessage(content=message))
@@ -307,15 +321,28 @@ Be concise but thorough."""
         """
         if self.use_react and self.agent:
             # Use ReAct streaming
-            messages = self.chat_history + [HumanMessage(content=message)]
-
+            messages = list(self.chat_history)
+            messages.append(HumanMessage(content=message))
+
+            # Each chunk is the full message state. It starts with the input
+            # (history + this question), so only messages after it are new; for
+            # those, yield the text not already sent for that message.
+            n_input = len(messages)
+            emitted: dict = {}  # message id (or position) -> text already yielded
             full_response = ""
-            for chunk in self.agent.stream({"messages": messages}):
-                if "messages" in chunk:
-                    for msg in chunk["messages"]:
-                        if isinstance(msg, AIMessage) and msg.content:
-                            full_response = msg.content
-                            yield msg.content
+            for chunk in self.agent.stream({"messages": messages}, stream_mode="values"):
+                state = chunk.get("messages", []) if isinstance(chunk, dict) else []
+                for position, msg in enumerate(state[n_input:], n_input):
+                    if not (isinstance(msg, AIMessage) and msg.content):
+                        continue
+                    key = msg.id or position
+                    content = msg.content
+                    sent = emitted.get(key, "")
+                    delta = content[len(sent) :] if content.startswith(sent) else content
+                    emitted[key] = content
+                    full_response = content
+                    if delta:
+                        yield delta
 
             self.chat_history.append(HumanMessage(content=message))
             if full_response:
@@ -325,15 +352,7 @@ Be concise but thorough."""
             intent = self._detect_intent(message)
             context = self._get_context(message, intent)
 
-            prompt = f"""{SYSTEM_PROMPT}
-
-{context}
-
----
-
-User Question: {message}
-
-Please provide a helpful, accurate response based on the data and context above."""
+            prompt = self._build_messages(message, context, _STREAM_PROMPT_PARTS)
 
             full_response = ""
             for chunk in self.llm.stream(prompt):
@@ -346,15 +365,32 @@ Please provide a helpful, accurate response based on the data and context above.
 
     def clear_history(self):
         """Clear the chat history."""
-        self.chat_history = []
+        self.chat_history.clear()
+
+    def invalidate_cache(self):
+        """Drop cached tool results so the next turn recomputes them."""
+        self._context_cache.clear()
+        self._knowledge_info = None
+
+    @cached_property
+    def tools_dict(self) -> dict:
+        """Tools by name."""
+        return {tool.name: tool for tool in self.tools}
+
+    @cached_property
+    def _tools_info(self) -> List[str]:
+        return [f"{t.name}: {t.description}" for t in self.tools]
 
     def get_knowledge_info(self) -> dict:
-        """Get information about the knowledge base."""
-        return get_knowledge_stats()
+        """Get information about the knowledge base (cached for CONTEXT_CACHE_TTL)."""
+        now = time.monotonic()
+        if self._knowledge_info is None or now - self._knowledge_info[0] >= CONTEXT_CACHE_TTL:
+            self._knowledge_info = (now, get_knowledge_stats())
+        return self._knowledge_info[1]
 
     def get_tools_info(self) -> List[str]:
         """Get list of available tools."""
-        return [f"{t.name}: {t.description}" for t in self.tools]
+        return self._tools_info
 
 
 def create_agent(
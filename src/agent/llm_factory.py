@@ -10,7 +10,8 @@ Change the provider in config to switch between:
 
 import os
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Dict, Optional
 
 
 class LLMProvider(Enum):
@@ -32,6 +33,68 @@ LLM_CONFIG = {
 }
 
 
+def _ollama_chat(model: str, temperature: float, api_key: Optional[str], **kwargs):
+    from langchain_ollama import ChatOllama
+
+    return ChatOllama(model=model, temperature=temperature, **kwargs)
+
+
+def _openai_chat(model: str, temperature: float, api_key: Optional[str], **kwargs):
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model=model or "gpt-4o", temperature=temperature, api_key=api_key, **kwargs)
+
+
+def _anthropic_chat(model: str, temperature: float, api_key: Optional[str], **kwargs):
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(
+        model=model or "claude-3-sonnet-20240229",
+        temperature=temperature,
+        api_key=api_key,
+        **kwargs,
+    )
+
+
+def _gemini_chat(model: str, temperature: float, api_key: Optional[str], **kwargs):
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model or "gemini-2.0-flash",
+        temperature=temperature,
+        google_api_key=api_key,
+        **kwargs,
+    )
+
+
+# Chat model constructor for each provider; each imports its integration on first use
+_LLM_FACTORIES: Dict[LLMProvider, Callable] = {
+    LLMProvider.OLLAMA: _ollama_chat,
+    LLMProvider.OPENAI: _openai_chat,
+    LLMProvider.ANTHROPIC: _anthropic_chat,
+    LLMProvider.GEMINI: _gemini_chat,
+}
+
+# Environment variable holding the API key for hosted providers
+_API_KEY_ENV = {
+    LLMProvider.OPENAI: "OPENAI_API_KEY",
+    LLMProvider.ANTHROPIC: "ANTHROPIC_API_KEY",
+    LLMProvider.GEMINI: "GOOGLE_API_KEY",
+}
+
+
+@lru_cache(maxsize=32)
+def _cached_llm(
+    provider: LLMProvider,
+    model: str,
+    temperature: float,
+    api_key: Optional[str],
+    kwargs_items: frozenset,
+):
+    """Build a chat model once per distinct configuration (cached)."""
+    return _LLM_FACTORIES[provider](model, temperature, api_key, **dict(kwargs_items))
+
+
 def get_llm(
     provider: Optional[LLMProvider] = None,
     model: Optional[str] = None,
@@ -41,6 +104,9 @@ def get_llm(
     """
     Factory function to get the appropriate LLM based on provider.
 
+    Identical calls return the same chat model instance; the API key is part
+    of the cache key, so changing it yields a fresh client.
+
     Args:
         provider: LLM provider (defaults to config)
         model: Model name (defaults to config)
@@ -61,49 +127,23 @@ def get_llm(
     model = model or LLM_CONFIG["model"]
     temperature = temperature if temperature is not None else LLM_CONFIG["temperature"]
 
-    if provider == LLMProvider.OLLAMA:
-        from langchain_ollama import ChatOllama
-
-        return ChatOllama(model=model, temperature=temperature, **kwargs)
-
-    elif provider == LLMProvider.OPENAI:
-        from langchain_openai import ChatOpenAI
+    factory = _LLM_FACTORIES.get(provider)
+    if factory is None:
+        raise ValueError(f"Unsupported provider: {provider}")
 
-        api_key = os.getenv("OPENAI_API_KEY")
+    api_key = None
+    env_var = _API_KEY_ENV.get(provider)
+    if env_var:
+        api_key = os.getenv(env_var)
         if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
-        return ChatOpenAI(
-            model=model or "gpt-4o", temperature=temperature, api_key=api_key, **kwargs
-        )
+            raise ValueError(f"{env_var} environment variable not set")
 
-    elif provider == LLMProvider.ANTHROPIC:
-        from langchain_anthropic import ChatAnthropic
-
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-        return ChatAnthropic(
-            model=model or "claude-3-sonnet-20240229",
-            temperature=temperature,
-            api_key=api_key,
-            **kwargs,
-        )
-
-    elif provider == LLMProvider.GEMINI:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY environment variable not set")
-        return ChatGoogleGenerativeAI(
-            model=model or "gemini-2.0-flash",
-            temperature=temperature,
-            google_api_key=api_key,
-            **kwargs,
-        )
-
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
+    try:
+        kwargs_items = frozenset(kwargs.items())
+    except TypeError:
+        # Unhashable arguments (e.g. callback lists) - build without caching
+        return factory(model, temperature, api_key, **kwargs)
+    return _cached_llm(provider, model, temperature, api_key, kwargs_items)
 
 
 def get_embeddings(provider: Optional[LLMProvider] = None):
@@ -112,29 +152,47 @@ def get_embeddings(provider: Optional[LLMProvider] = None):
 
     For Ollama, uses nomic-embed-text.
     For others, uses their native embedding models.
+    Instances are cached per provider, so repeated calls reuse one client/model.
     """
-    provider = provider or LLM_CONFIG["provider"]
+    return _embeddings_for(provider or LLM_CONFIG["provider"])
 
-    if provider == LLMProvider.OLLAMA:
-        from langchain_ollama import OllamaEmbeddings
 
-        return OllamaEmbeddings(model="nomic-embed-text")
+def _ollama_embeddings():
+    from langchain_ollama import OllamaEmbeddings
 
-    elif provider == LLMProvider.OPENAI:
-        from langchain_openai import OpenAIEmbeddings
+    return OllamaEmbeddings(model="nomic-embed-text")
 
-        return OpenAIEmbeddings(model="text-embedding-3-small")
 
-    elif provider == LLMProvider.GEMINI:
-        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+def _openai_embeddings():
+    from langchain_openai import OpenAIEmbeddings
 
-        return GoogleGenerativeAIEmbeddings(model="models/embedding-001")
+    return OpenAIEmbeddings(model="text-embedding-3-small")
+
+
+def _gemini_embeddings():
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    return GoogleGenerativeAIEmbeddings(model="models/embedding-001")
+
+
+def _huggingface_embeddings():
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(model_name="BAAI/bge-small-en-v1.5")
+
+
+# Embeddings constructor per provider; others fall back to HuggingFace
+_EMBEDDING_FACTORIES: Dict[LLMProvider, Callable] = {
+    LLMProvider.OLLAMA: _ollama_embeddings,
+    LLMProvider.OPENAI: _openai_embeddings,
+    LLMProvider.GEMINI: _gemini_embeddings,
+}
 
-    else:
-        # Fallback to HuggingFace embeddings
-        from langchain_huggingface import HuggingFaceEmbeddings
 
-        return HuggingFaceEmbeddings(model_name="BAAI/bge-small-en-v1.5")
+@lru_cache(maxsize=None)
+def _embeddings_for(provider: LLMProvider):
+    """Build the embeddings model for a resolved provider (cached)."""
+    return _EMBEDDING_FACTORIES.get(provider, _huggingface_embeddings)()
 
 
 def set_provider(provider: LLMProvider, model: Optional[str] = None):
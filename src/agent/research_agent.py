@@ -14,21 +14,267 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import heapq
+import itertools
 import logging
+import re
+import sqlite3
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
+from pathlib import Path
 from typing import Any, Callable
+from urllib.parse import urlsplit, urlunsplit
 
-from .knowledge import add_document, get_vectorstore, search_knowledge
+import numpy as np
+
+from .knowledge import add_document, get_embeddings, get_vectorstore, search_knowledge
 from .llm_factory import get_llm
 from .source_verification import SourceVerification, TrustLevel, is_source_approved, verify_source
 
+# Check for numba (fused similarity scan for the semantic cache)
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# On-disk cache of LLM responses, shared by research sessions
+LLM_CACHE_PATH = Path(__file__).parent.parent.parent / ".cache" / "research_llm.sqlite3"
+LLM_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# Jaccard overlap (word 3-gram shingles) above which a snippet counts as a repeat
+SNIPPET_OVERLAP_THRESHOLD = 0.9
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# One INSIGHT/CONFIDENCE/SOURCE field per line of an extraction response
+_INSIGHT_RE = re.compile(r"^[ \t]*(INSIGHT|CONFIDENCE|SOURCE):(.*)$", re.M)
+
+# Start of the follow-up section of an extraction response: the requested
+# marker, or a follow-up heading the model wrote instead
+_FOLLOW_UPS_RE = re.compile(
+    r"FOLLOW_UPS:|^[ \t*#]*(?i:follow[-_ ]?ups?(?: queries)?)[ \t*]*:", re.M
+)
+
+# List numbering ("1.", "2)", "3 -") in front of a follow-up query
+_LEAD_RE = re.compile(r"^[0-9.)\-\] ]+")
+
+# Insights included in the synthesis prompt, highest confidence first
+MAX_REPORT_INSIGHTS = 20
+
+# Cosine similarity above which a paraphrased request reuses an earlier response
+SEMANTIC_CACHE_THRESHOLD = 0.90
+# Entries kept per prompt kind; the oldest is overwritten once full
+SEMANTIC_CACHE_SIZE = 256
+
+# Distinguishes research sessions in the semantic cache
+_SESSION_IDS = itertools.count()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of LLM responses keyed by SHA-256 of model id + prompt.
+
+    Entries older than ``ttl_seconds`` are ignored on lookup and overwritten
+    on the next store. Safe to share between threads.
+    """
+
+    def __init__(self, path: Path = LLM_CACHE_PATH, ttl_seconds: float = LLM_CACHE_TTL):
+        self.ttl_seconds = ttl_seconds
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, content TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(model_id: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model_id}\0{prompt}".encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM responses WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl_seconds),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, created) VALUES (?, ?, ?)",
+                (key, content, time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+
+def _best_match_numpy(
+    vectors: np.ndarray, query: np.ndarray, allowed: np.ndarray
+) -> tuple[int, float]:
+    """Index and cosine similarity of the allowed row closest to a normalized query."""
+    sims = vectors @ query
+    sims[~allowed] = -2.0
+    best = int(np.argmax(sims))
+    return best, float(sims[best])
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _best_match(
+        vectors: np.ndarray, query: np.ndarray, allowed: np.ndarray
+    ) -> tuple[int, float]:
+        """Fused dot-product/argmax scan over allowed normalized rows, without temporaries."""
+        # Cosine similarity of normalized vectors is >= -1 (no inf under fastmath)
+        best, best_score = 0, -2.0
+        for i in range(vectors.shape[0]):
+            if not allowed[i]:
+                continue
+            score = 0.0
+            for j in range(vectors.shape[1]):
+                score += vectors[i, j] * query[j]
+            if score > best_score:
+                best, best_score = i, score
+        return best, best_score
+
+else:
+    _best_match = _best_match_numpy
+
+
+class SemanticCacheTable:
+    """
+    Fixed-size ring buffer of (normalized key embedding, response) entries.
+
+    Embeddings live in one array allocated on the first insert, so storing an
+    entry is a row write; once full, the oldest entry is overwritten. Each
+    entry records the research depth and session it came from: lookups only
+    match entries from the same depth of other sessions.
+    """
+
+    def __init__(self, capacity: int = SEMANTIC_CACHE_SIZE):
+        self.capacity = capacity
+        self.vectors: np.ndarray | None = None
+        self.depths = np.zeros(capacity, dtype=np.int64)
+        self.sessions = np.full(capacity, -1, dtype=np.int64)
+        self.responses: list[str] = []
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def lookup(self, vector: np.ndarray, depth: int, session: int) -> tuple[str, float] | None:
+        """Best (response, similarity) among matching entries, or None if there are none."""
+        with self._lock:
+            size = len(self.responses)
+            if not size:
+                return None
+            allowed = (self.depths[:size] == depth) & (self.sessions[:size] != session)
+            if not allowed.any():
+                return None
+            best, score = _best_match(self.vectors[:size], vector, allowed)
+            return self.responses[best], score
+
+    def add(self, vector: np.ndarray, response: str, depth: int, session: int) -> None:
+        with self._lock:
+            if self.vectors is None:
+                self.vectors = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+            i = self._next
+            self.vectors[i] = vector
+            self.depths[i] = depth
+            self.sessions[i] = session
+            if i < len(self.responses):
+                self.responses[i] = response
+            else:
+                self.responses.append(response)
+            self._next = (i + 1) % self.capacity
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code.
 
-@dataclass
+    Uses asyncio.run, or a helper thread when this thread already has a
+    running event loop (e.g. inside a notebook).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _url_key(url: str) -> int:
+    """
+    64-bit digest of a URL with the scheme and host lowercased and the
+    fragment dropped. The query is kept, since it selects e.g. the USGS site.
+    """
+    parts = urlsplit(url)
+    canonical = urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, "")
+    )
+    return int.from_bytes(hashlib.blake2b(canonical.encode(), digest_size=8).digest(), "little")
+
+
+def _shingles(text: str, n: int = 3) -> set[tuple[str, ...]]:
+    """Word n-gram shingles of a text, for near-duplicate detection."""
+    words = text.lower().split()
+    return {tuple(words[i : i + n]) for i in range(max(1, len(words) - n + 1))}
+
+
+def _dedupe_snippets(results: list[SearchResult]) -> list[tuple[SearchResult, str]]:
+    """
+    Drop repeated content across search results before it reaches the LLM.
+
+    Results whose snippet overlaps an already kept one by more than
+    SNIPPET_OVERLAP_THRESHOLD are dropped; from the rest, sentences already
+    seen in an earlier result are removed.
+
+    Returns:
+        (result, deduplicated snippet) pairs, in the original order
+    """
+    kept: list[tuple[SearchResult, str]] = []
+    kept_shingles: list[set] = []
+    seen_sentences: set[bytes] = set()
+
+    for r in results:
+        shingles = _shingles(r.snippet)
+        if any(
+            len(shingles & other) / len(shingles | other) > SNIPPET_OVERLAP_THRESHOLD
+            for other in kept_shingles
+        ):
+            continue
+
+        sentences = []
+        for sentence in _SENTENCE_SPLIT_RE.split(r.snippet.strip()):
+            digest = hashlib.blake2b(sentence.encode(), digest_size=8).digest()
+            if sentence and digest not in seen_sentences:
+                seen_sentences.add(digest)
+                sentences.append(sentence)
+
+        if sentences:
+            kept.append((r, " ".join(sentences)))
+            kept_shingles.append(shingles)
+
+    return kept
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result."""
 
@@ -46,7 +292,7 @@ class SearchResult:
         return self.verification.is_approved
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchInsight:
     """An insight extracted from research."""
 
@@ -55,7 +301,7 @@ class ResearchInsight:
     confidence: float
     verified: bool = False
     trust_level: str = "unknown"
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Unix epoch seconds
 
     def to_dict(self) -> dict:
         return {
@@ -64,19 +310,20 @@ class ResearchInsight:
             "confidence": self.confidence,
             "verified": self.verified,
             "trust_level": self.trust_level,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchContext:
     """Tracks the state of a research session."""
 
     original_query: str
     current_query: str = ""
     insights: list[ResearchInsight] = field(default_factory=list)
-    visited_urls: set[str] = field(default_factory=set)
-    rejected_urls: set[str] = field(default_factory=set)  # Unverified sources
+    visited_urls: list[str] = field(default_factory=list)  # Accepted sources, in order
+    # Digests (see _url_key) of every URL already accepted or rejected
+    seen_url_keys: set[int] = field(default_factory=set, repr=False)
     current_depth: int = 0
     max_depth: int = 3
     search_history: list[str] = field(default_factory=list)
@@ -88,51 +335,65 @@ class ResearchContext:
     status: str = "idle"
     progress_callback: Callable[[str, float], None] | None = None
 
+    # Contents of self.insights, for constant-time duplicate checks
+    _insight_contents: set[str] = field(default_factory=set, repr=False)
+    # Prompt text for search_history / insights, extended as entries are added
+    _history_text: str = field(default="", repr=False)
+    _insights_summary: str = field(default="", repr=False)
+    session_id: int = field(default_factory=lambda: next(_SESSION_IDS), repr=False)
+
     def add_insight(self, insight: ResearchInsight) -> None:
         """Add an insight, avoiding duplicates. Only add verified insights."""
         if not insight.verified:
             logger.warning(f"Rejecting unverified insight from: {insight.source_url}")
             return
-        existing_contents = {i.content for i in self.insights}
-        if insight.content not in existing_contents:
+        if insight.content not in self._insight_contents:
+            self._insight_contents.add(insight.content)
             self.insights.append(insight)
+            line = f"{len(self.insights)}. {insight.content[:200]}..."
+            self._insights_summary = (
+                f"{self._insights_summary}\n{line}" if self._insights_summary else line
+            )
 
     def get_insights_summary(self) -> str:
         """Get a summary of all insights collected."""
-        if not self.insights:
-            return "No insights collected yet."
+        return self._insights_summary or "No insights collected yet."
 
-        summaries = []
-        for i, insight in enumerate(self.insights, 1):
-            summaries.append(f"{i}. {insight.content[:200]}...")
-        return "\n".join(summaries)
+    def add_search(self, query: str) -> None:
+        """Record a query in the search history."""
+        self.search_history.append(query)
+        line = f"- {query}"
+        self._history_text = f"{self._history_text}\n{line}" if self._history_text else line
+
+    def get_history_text(self) -> str:
+        """Search history as a bulleted list for prompts."""
+        return self._history_text
 
     def should_continue(self) -> bool:
         """Check if research should continue."""
         return self.current_depth < self.max_depth and not self.is_stopped()
 
-    def is_stopped(self) -> bool:
-        """Check if research has been stopped or timed out."""
+    def is_stopped(self, now: float | None = None) -> bool:
+        """Check if research has been stopped or timed out (optionally as of ``now``)."""
         if self.stop_requested:
             self.status = "stopped"
             return True
-        if self.is_timed_out():
+        if self.is_timed_out(now):
             self.status = "timeout"
             return True
         return False
 
-    def is_timed_out(self) -> bool:
+    def is_timed_out(self, now: float | None = None) -> bool:
         """Check if research has exceeded timeout."""
-        elapsed = time.time() - self.start_time
-        return elapsed > self.timeout_seconds
+        return self.elapsed_time(now) > self.timeout_seconds
 
-    def elapsed_time(self) -> float:
+    def elapsed_time(self, now: float | None = None) -> float:
         """Get elapsed time in seconds."""
-        return time.time() - self.start_time
+        return (now if now is not None else time.time()) - self.start_time
 
-    def remaining_time(self) -> float:
+    def remaining_time(self, now: float | None = None) -> float:
         """Get remaining time before timeout."""
-        return max(0, self.timeout_seconds - self.elapsed_time())
+        return max(0, self.timeout_seconds - self.elapsed_time(now))
 
     def request_stop(self) -> None:
         """Request the research to stop."""
@@ -174,6 +435,7 @@ class DeepResearchAgent:
         auto_learn: bool = True,
         min_confidence_for_learning: float = 0.7,
         timeout_seconds: float = 300.0,  # 5 minutes default
+        cache_llm_responses: bool = True,
     ):
         """
         Initialize the Deep Research Agent.
@@ -187,6 +449,8 @@ class DeepResearchAgent:
             auto_learn: Whether to automatically add verified insights to knowledge base
             min_confidence_for_learning: Minimum confidence for auto-learning (0.0-1.0)
             timeout_seconds: Maximum time for research in seconds (default 5 min)
+            cache_llm_responses: Reuse responses to identical prompts from an
+                on-disk cache (LLM_CACHE_PATH) instead of calling the LLM again
         """
         self.max_depth = max_depth
         self.max_results_per_search = max_results_per_search
@@ -195,12 +459,23 @@ class DeepResearchAgent:
         self.min_confidence_for_learning = min_confidence_for_learning
         self.timeout_seconds = timeout_seconds
 
-        # Active research context (for stop control)
-        self._active_context: ResearchContext | None = None
+        # Active research contexts, one per running call (for stop control)
+        self._active_contexts: dict[int, ResearchContext] = {}
         self._research_lock = threading.Lock()
 
         # Initialize LLM
         self.llm = get_llm(provider=llm_provider, model=llm_model)
+        self._llm_cache: LLMResponseCache | None = None
+        if cache_llm_responses:
+            try:
+                self._llm_cache = LLMResponseCache()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache disabled: {e}")
+        model_name = getattr(self.llm, "model", None) or getattr(self.llm, "model_name", "")
+        self._model_id = f"{type(self.llm).__name__}:{model_name}"
+
+        # Near-miss cache per prompt kind
+        self._semantic_cache: dict[str, SemanticCacheTable] = {}
 
         # Web search availability
         self._ddg_available = False
@@ -219,17 +494,74 @@ class DeepResearchAgent:
                     self._ddg = DDGS()
                 except ImportError:
                     logger.warning("ddgs not installed. " "Install with: pip install ddgs")
+        # The DDGS client is not thread-safe; concurrent runs take turns using it
+        self._ddg_lock = threading.Lock()
+
+        # Blocking searches run here; unlike the loop's default executor, a web
+        # search abandoned at the research timeout does not hold up asyncio.run
+        self._search_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="research-search")
+
+    async def _ainvoke(self, prompt: str) -> str:
+        """Invoke the LLM and return the response text, via the response cache."""
+        if self._llm_cache is None:
+            return (await self.llm.ainvoke(prompt)).content
+
+        key = LLMResponseCache.make_key(self._model_id, prompt)
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            return cached
+
+        content = (await self.llm.ainvoke(prompt)).content
+        try:
+            self._llm_cache.set(key, content)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to cache LLM response: {e}")
+        return content
+
+    async def _semantic_invoke(self, kind: str, context: ResearchContext, prompt: str) -> str:
+        """
+        Invoke the LLM, reusing the response of an earlier request of the same
+        kind whose key text (see _semantic_key) is a close paraphrase of this
+        one, made at the same depth by another research session.
+
+        Exact prompt repeats are still served by the on-disk cache first.
+        """
+        if self._llm_cache is not None:
+            cached = self._llm_cache.get(LLMResponseCache.make_key(self._model_id, prompt))
+            if cached is not None:
+                return cached
+
+        try:
+            embedding = await asyncio.to_thread(
+                get_embeddings().embed_query, self._semantic_key(context)
+            )
+            vector = np.asarray(embedding, dtype=np.float32)
+            vector /= np.linalg.norm(vector) or 1.0
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup skipped: {e}")
+            return await self._ainvoke(prompt)
+
+        table = self._semantic_cache.setdefault(kind, SemanticCacheTable())
+        match = table.lookup(vector, context.current_depth, context.session_id)
+        if match is not None and match[1] > SEMANTIC_CACHE_THRESHOLD:
+            logger.info(f"Semantic cache hit for {kind} (similarity {match[1]:.2f})")
+            return match[0]
+
+        content = await self._ainvoke(prompt)
+        table.add(vector, content, context.current_depth, context.session_id)
+        return content
 
     def stop(self) -> bool:
         """
-        Stop the currently running research.
+        Stop every research currently running on this agent.
 
         Returns:
             True if a research was stopped, False if none was running
         """
         with self._research_lock:
-            if self._active_context:
-                self._active_context.request_stop()
+            for context in self._active_contexts.values():
+                context.request_stop()
+            if self._active_contexts:
                 logger.info("Research stop requested")
                 return True
             return False
@@ -237,20 +569,21 @@ class DeepResearchAgent:
     def is_running(self) -> bool:
         """Check if research is currently running."""
         with self._research_lock:
-            return self._active_context is not None and not self._active_context.is_stopped()
+            return any(not c.is_stopped() for c in self._active_contexts.values())
 
     def get_status(self) -> dict[str, Any]:
-        """Get current research status."""
+        """Get the status of the most recently started research."""
         with self._research_lock:
-            if self._active_context:
+            if self._active_contexts:
+                context = next(reversed(self._active_contexts.values()))
                 return {
                     "running": True,
-                    "status": self._active_context.status,
-                    "depth": self._active_context.current_depth,
-                    "max_depth": self._active_context.max_depth,
-                    "insights": len(self._active_context.insights),
-                    "elapsed": self._active_context.elapsed_time(),
-                    "remaining": self._active_context.remaining_time(),
+                    "status": context.status,
+                    "depth": context.current_depth,
+                    "max_depth": context.max_depth,
+                    "insights": len(context.insights),
+                    "elapsed": context.elapsed_time(),
+                    "remaining": context.remaining_time(),
                 }
             return {"running": False, "status": "idle"}
 
@@ -264,6 +597,87 @@ class DeepResearchAgent:
         """
         Conduct deep research on a query.
 
+        Args:
+            query: The research question
+            max_depth: Override default max depth
+            timeout: Override default timeout in seconds
+            progress_callback: Optional callback for progress updates (message, progress 0-1)
+
+        Returns:
+            Dict containing research results and synthesis
+        """
+        return _run_sync(self.research_async(query, max_depth, timeout, progress_callback))
+
+    def _save_learnings(self, context: ResearchContext) -> int:
+        """
+        Save high-confidence verified insights to the knowledge base.
+        This enables continuous learning from research.
+
+        Args:
+            context: Research context with insights
+
+        Returns:
+            Number of insights added to knowledge base
+        """
+        learned = 0
+
+        for insight in context.insights:
+            # Only save high-confidence verified insights
+            if insight.verified and insight.confidence >= self.min_confidence_for_learning:
+
+                # Format content for knowledge base
+                content = f"""Research Insight: {insight.content}
+
+Original Query: {context.original_query}
+Source: {insight.source_url}
+Confidence: {insight.confidence:.0%}
+Trust Level: {insight.trust_level}
+Date: {datetime.fromtimestamp(insight.timestamp).isoformat()}
+"""
+
+                metadata = {
+                    "doc_type": "research_insight",
+                    "source_url": insight.source_url,
+                    "confidence": insight.confidence,
+                    "trust_level": insight.trust_level,
+                    "query": context.original_query,
+                    "auto_learned": True,
+                }
+
+                try:
+                    # Add to knowledge base (verification already done)
+                    success = add_document(
+                        content=content,
+                        metadata=metadata,
+                        source_url=insight.source_url,
+                        require_verification=False,  # Already verified during research
+                    )
+                    if success:
+                        learned += 1
+                        logger.info(f"📚 Learned: {insight.content[:50]}...")
+                except Exception as e:
+                    logger.error(f"Failed to save learning: {e}")
+
+        if learned > 0:
+            logger.info(f"✅ Added {learned} insights to knowledge base (auto-learning)")
+
+        return learned
+
+    async def research_async(
+        self,
+        query: str,
+        max_depth: int | None = None,
+        timeout: float | None = None,
+        progress_callback: Callable[[str, float], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Conduct deep research on a query (async).
+
+        LLM calls are awaited natively; knowledge-base and web searches run in
+        worker threads, so several calls can share one event loop; each call
+        tracks its own context, and web searches are serialized on the shared
+        DDGS client.
+
         Args:
             query: The research question
             max_depth: Override default max depth
@@ -286,39 +700,39 @@ class DeepResearchAgent:
 
         # Register active context for stop control
         with self._research_lock:
-            self._active_context = context
+            self._active_contexts[id(context)] = context
 
         try:
             logger.info(f"Starting deep research: {query} (timeout: {timeout_secs}s)")
             context.update_progress("Starting research...")
 
             # Execute research graph
-            self._research_graph(context)
+            await self._research_graph(context)
 
             # Check if we were stopped
             if context.stop_requested:
                 context.update_progress("Research stopped by user")
                 report = (
-                    self._synthesize_report(context)
+                    await self._synthesize_report(context)
                     if context.insights
                     else "Research was stopped before completion."
                 )
             elif context.is_timed_out():
                 context.update_progress("Research timed out")
                 report = (
-                    self._synthesize_report(context)
+                    await self._synthesize_report(context)
                     if context.insights
                     else "Research timed out before completion."
                 )
             else:
                 context.update_progress("Synthesizing report...")
-                report = self._synthesize_report(context)
+                report = await self._synthesize_report(context)
 
             # Auto-learn: Add high-confidence insights to knowledge base
             learned_count = 0
             if self.auto_learn and context.insights:
                 context.update_progress("Saving learnings...")
-                learned_count = self._save_learnings(context)
+                learned_count = await asyncio.to_thread(self._save_learnings, context)
 
             context.update_progress("Complete")
             context.status = "complete"
@@ -336,89 +750,32 @@ class DeepResearchAgent:
                 "timed_out": context.is_timed_out(),
             }
         finally:
-            # Clear active context
+            # Unregister this call's context only
             with self._research_lock:
-                self._active_context = None
-
-    def _save_learnings(self, context: ResearchContext) -> int:
-        """
-        Save high-confidence verified insights to the knowledge base.
-        This enables continuous learning from research.
-
-        Args:
-            context: Research context with insights
-
-        Returns:
-            Number of insights added to knowledge base
-        """
-        learned = 0
-
-        for insight in context.insights:
-            # Only save high-confidence verified insights
-            if insight.verified and insight.confidence >= self.min_confidence_for_learning:
-
-                # Format content for knowledge base
-                content = f"""Research Insight: {insight.content}
-
-Original Query: {context.original_query}
-Source: {insight.source_url}
-Confidence: {insight.confidence:.0%}
-Trust Level: {insight.trust_level}
-Date: {insight.timestamp.isoformat()}
-"""
-
-                metadata = {
-                    "doc_type": "research_insight",
-                    "source_url": insight.source_url,
-                    "confidence": insight.confidence,
-                    "trust_level": insight.trust_level,
-                    "query": context.original_query,
-                    "auto_learned": True,
-                }
-
-                try:
-                    # Add to knowledge base (verification already done)
-                    success = add_document(
-                        content=content,
-                        metadata=metadata,
-                        source_url=insight.source_url,
-                        require_verification=False,  # Already verified during research
-                    )
-                    if success:
-                        learned += 1
-                        logger.info(f"📚 Learned: {insight.content[:50]}...")
-                except Exception as e:
-                    logger.error(f"Failed to save learning: {e}")
-
-        if learned > 0:
-            logger.info(f"✅ Added {learned} insights to knowledge base (auto-learning)")
+                self._active_contexts.pop(id(context), None)
 
-        return learned
-
-    async def research_async(self, query: str, max_depth: int | None = None) -> dict[str, Any]:
-        """Async version of research."""
-        return await asyncio.to_thread(self.research, query, max_depth)
-
-    def _research_graph(self, context: ResearchContext) -> None:
+    async def _research_graph(self, context: ResearchContext) -> None:
         """
         Execute the research graph - iterative search and analysis.
 
         This implements the core research loop:
         1. Optimize query
         2. Search (knowledge base + web)
-        3. Extract insights
-        4. Generate follow-up queries
+        3. Extract insights and generate follow-up queries (one LLM call)
+        4. Check whether enough insights have been gathered
         5. Repeat until max depth, sufficient insights, timeout, or stop
         """
-        while context.should_continue():
-            # Check for stop/timeout at start of each iteration
-            if context.is_stopped():
+        while context.current_depth < context.max_depth:
+            # Check for stop/timeout at start of each iteration; the clock is
+            # read once and shared by the checks and the progress message
+            now = time.time()
+            if context.is_stopped(now):
                 logger.info(f"Research stopped: {context.status}")
                 break
 
             context.current_depth += 1
-            elapsed = context.elapsed_time()
-            remaining = context.remaining_time()
+            elapsed = context.elapsed_time(now)
+            remaining = context.remaining_time(now)
 
             context.update_progress(
                 f"Depth {context.current_depth}/{context.max_depth} "
@@ -436,15 +793,15 @@ Date: {insight.timestamp.isoformat()}
             # Step 1: Optimize query based on current context
             if context.current_depth > 1:
                 context.update_progress(f"Optimizing query (depth {context.current_depth})...")
-                context.current_query = self._generate_optimized_query(context)
+                context.current_query = await self._generate_optimized_query(context)
                 if context.is_stopped():
                     break
 
-            context.search_history.append(context.current_query)
+            context.add_search(context.current_query)
 
             # Step 2: Search multiple sources
             context.update_progress(f"Searching: {context.current_query[:50]}...")
-            results = self._search(context.current_query, context)
+            results = await self._search(context.current_query, context)
             if context.is_stopped():
                 break
 
@@ -452,9 +809,9 @@ Date: {insight.timestamp.isoformat()}
                 logger.info("No new results found, ending research")
                 break
 
-            # Step 3: Extract insights from results
+            # Step 3: Extract insights from results (and plan follow-ups in the same call)
             context.update_progress(f"Extracting insights from {len(results)} results...")
-            new_insights = self._extract_insights(results, context)
+            new_insights, follow_ups = await self._extract_and_follow_up(results, context)
             if context.is_stopped():
                 break
 
@@ -468,18 +825,21 @@ Date: {insight.timestamp.isoformat()}
                 logger.info("Research complete - sufficient insights gathered")
                 break
 
-            # Step 5: Generate follow-up queries for next iteration
+            # Step 5: Continue with the follow-up queries planned in step 3
             if context.should_continue():
-                context.update_progress("Generating follow-up queries...")
-                follow_ups = self._generate_follow_ups(context)
-                if context.is_stopped():
-                    break
                 if follow_ups:
                     context.current_query = follow_ups[0]
                 else:
                     break
 
-    def _generate_optimized_query(self, context: ResearchContext) -> str:
+    @staticmethod
+    def _semantic_key(context: ResearchContext) -> str:
+        """Text identifying a query-planning request for the semantic cache."""
+        return "\n".join(
+            [context.original_query, *context.search_history, context.get_insights_summary()]
+        )
+
+    async def _generate_optimized_query(self, context: ResearchContext) -> str:
         """
         Generate an optimized search query based on current research state.
         """
@@ -488,7 +848,7 @@ Date: {insight.timestamp.isoformat()}
 Original research question: {context.original_query}
 
 Previous searches:
-{chr(10).join(f'- {q}' for q in context.search_history)}
+{context.get_history_text()}
 
 Insights collected so far:
 {context.get_insights_summary()}
@@ -502,43 +862,53 @@ The query should:
 Return ONLY the search query, nothing else."""
 
         try:
-            response = self.llm.invoke(prompt)
-            return response.content.strip().strip("\"'")
+            response = await self._semantic_invoke("optimize", context, prompt)
+            return response.strip().strip("\"'")
         except Exception as e:
             logger.error(f"Query optimization failed: {e}")
             return context.original_query
 
-    def _search(self, query: str, context: ResearchContext) -> list[SearchResult]:
+    async def _search(self, query: str, context: ResearchContext) -> list[SearchResult]:
         """
         Search multiple sources for information.
-        """
-        results = []
 
-        # Search local knowledge base first
-        try:
-            kb_docs = search_knowledge(query, k=3, score_threshold=0.0)
-            for doc in kb_docs:
-                results.append(
-                    SearchResult(
-                        title=doc.metadata.get("source_file", "Knowledge Base"),
-                        url="local://knowledge_base",
-                        snippet=doc.page_content[:500],
-                        source="knowledge_base",
-                    )
+        The knowledge-base and web searches run concurrently in worker threads.
+        """
+        loop = asyncio.get_running_loop()
+        searches = [loop.run_in_executor(self._search_pool, self._search_kb, query)]
+        if self._ddg_available and self.use_web_search:
+            searches.append(
+                asyncio.wait_for(
+                    loop.run_in_executor(self._search_pool, self._search_web, query, context),
+                    timeout=context.remaining_time(),
                 )
-        except Exception as e:
-            logger.error(f"Knowledge base search failed: {e}")
+            )
 
-        # Web search if available
-        if self._ddg_available and self.use_web_search:
-            try:
-                web_results = self._search_web(query, context)
-                results.extend(web_results)
-            except Exception as e:
-                logger.error(f"Web search failed: {e}")
+        results = []
+        # Knowledge base results first, then web results
+        outcomes = await asyncio.gather(*searches, return_exceptions=True)
+        for name, outcome in zip(("Knowledge base", "Web"), outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(f"{name} search did not finish before the research timeout")
+            elif isinstance(outcome, Exception):
+                logger.error(f"{name} search failed: {outcome}")
+            else:
+                results.extend(outcome)
 
         return results
 
+    def _search_kb(self, query: str) -> list[SearchResult]:
+        """Search the local knowledge base."""
+        return [
+            SearchResult(
+                title=doc.metadata.get("source_file", "Knowledge Base"),
+                url="local://knowledge_base",
+                snippet=doc.page_content[:500],
+                source="knowledge_base",
+            )
+            for doc in search_knowledge(query, k=3, score_threshold=0.0)
+        ]
+
     def _search_web(self, query: str, context: ResearchContext) -> list[SearchResult]:
         """
         Search the web using DuckDuckGo.
@@ -551,16 +921,25 @@ Return ONLY the search query, nothing else."""
             # Add groundwater context to query
             enhanced_query = f"groundwater hydrogeology {query}"
 
-            search_results = self._ddg.text(enhanced_query, max_results=self.max_results_per_search)
+            with self._ddg_lock:
+                search_results = self._ddg.text(
+                    enhanced_query, max_results=self.max_results_per_search
+                )
 
+            # Consume results lazily and stop once enough sources are verified
             for result in search_results:
+                if context.is_stopped() or len(results) >= self.max_results_per_search:
+                    break
                 url = result.get("href", "")
-                if url not in context.visited_urls:
+                # Skip URLs already accepted or rejected in this session
+                url_key = _url_key(url)
+                if url_key not in context.seen_url_keys:
+                    context.seen_url_keys.add(url_key)
                     # Verify source before adding
                     verification = verify_source(url)
 
                     if verification.is_approved:
-                        context.visited_urls.add(url)
+                        context.visited_urls.append(url)
                         results.append(
                             SearchResult(
                                 title=result.get("title", ""),
@@ -572,7 +951,6 @@ Return ONLY the search query, nothing else."""
                         )
                         logger.info(f"✓ Verified source: {url} ({verification.trust_level.value})")
                     else:
-                        context.rejected_urls.add(url)
                         logger.warning(
                             f"✗ Rejected unverified source: {url} - {verification.reason}"
                         )
@@ -581,28 +959,36 @@ Return ONLY the search query, nothing else."""
 
         return results
 
-    def _extract_insights(
+    async def _extract_and_follow_up(
         self, results: list[SearchResult], context: ResearchContext
-    ) -> list[ResearchInsight]:
+    ) -> tuple[list[ResearchInsight], list[str]]:
         """
         Extract key insights from VERIFIED search results using LLM.
         Only processes results that passed source verification.
+
+        While more depth remains, the same LLM call also proposes follow-up
+        queries, saving a separate follow-up request per iteration.
+
+        Returns:
+            (new insights, follow-up queries)
         """
+        want_follow_ups = context.current_depth < context.max_depth
+
         # Filter to only verified results
         verified_results = [r for r in results if r.is_verified or r.source == "knowledge_base"]
 
         if not verified_results:
             logger.warning("No verified sources to extract insights from")
-            return []
+            return [], await self._generate_follow_ups(context) if want_follow_ups else []
 
-        # Prepare content for analysis
+        # Prepare content for analysis, without repeated snippets or sentences
         content_parts = []
-        for r in verified_results:
+        for r, snippet in _dedupe_snippets(verified_results):
             trust_info = ""
             if r.verification:
                 trust_info = f" [Trust: {r.verification.trust_level.value}]"
             content_parts.append(
-                f"Source: {r.title}{trust_info}\nURL: {r.url}\nContent: {r.snippet}\n"
+                f"Source: {r.title}{trust_info}\nURL: {r.url}\nContent: {snippet}\n"
             )
 
         combined_content = "\n---\n".join(content_parts)
@@ -628,35 +1014,67 @@ SOURCE: [source url or title]
 
 Extract up to 3 insights. Only include genuinely useful information."""
 
+        if want_follow_ups:
+            prompt += f"""
+
+Then identify what information is still missing to fully answer the original question.
+
+Insights gathered before this search:
+{context.get_insights_summary()}
+
+Previous searches:
+{context.get_history_text()}
+
+Generate 1-2 follow-up search queries that would help fill these gaps.
+Focus on groundwater/hydrogeology topics.
+
+Format:
+FOLLOW_UPS:
+1. [first follow-up query]
+2. [second follow-up query]
+
+If the research seems complete, respond with: FOLLOW_UPS: COMPLETE"""
+
         try:
-            response = self.llm.invoke(prompt)
-            return self._parse_insights(response.content, results)
+            response = await self._ainvoke(prompt)
         except Exception as e:
             logger.error(f"Insight extraction failed: {e}")
-            return []
+            return [], []
+
+        marker = _FOLLOW_UPS_RE.search(response)
+        if marker is None:
+            insights = self._parse_insights(response, results)
+            if not want_follow_ups:
+                return insights, []
+            # Without follow-ups the research would end here, so ask for them
+            logger.info("Extraction response had no follow-up section, requesting one")
+            return insights, await self._generate_follow_ups(context)
+
+        return (
+            self._parse_insights(response[: marker.start()], results),
+            self._parse_follow_ups(response[marker.end() :], context),
+        )
 
     def _parse_insights(
         self, llm_response: str, results: list[SearchResult]
     ) -> list[ResearchInsight]:
         """Parse LLM response into ResearchInsight objects."""
         insights = []
-
-        lines = llm_response.strip().split("\n")
         current_insight = {}
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith("INSIGHT:"):
+        for match in _INSIGHT_RE.finditer(llm_response):
+            field_name, value = match.group(1), match.group(2).strip()
+            if field_name == "INSIGHT":
                 if current_insight.get("content"):
                     insights.append(self._create_insight(current_insight, results))
-                current_insight = {"content": line[8:].strip()}
-            elif line.startswith("CONFIDENCE:"):
+                current_insight = {"content": value}
+            elif field_name == "CONFIDENCE":
                 try:
-                    current_insight["confidence"] = float(line[11:].strip())
+                    current_insight["confidence"] = float(value)
                 except ValueError:
                     current_insight["confidence"] = 0.5
-            elif line.startswith("SOURCE:"):
-                current_insight["source"] = line[7:].strip()
+            else:
+                current_insight["source"] = value
 
         # Add last insight
         if current_insight.get("content"):
@@ -708,9 +1126,12 @@ Extract up to 3 insights. Only include genuinely useful information."""
             trust_level=trust_level,
         )
 
-    def _generate_follow_ups(self, context: ResearchContext) -> list[str]:
+    async def _generate_follow_ups(self, context: ResearchContext) -> list[str]:
         """
         Generate follow-up queries based on current research state.
+
+        Used when a search produced nothing to extract insights from;
+        otherwise follow-ups come from _extract_and_follow_up.
         """
         prompt = f"""You are a research assistant identifying knowledge gaps.
 
@@ -720,7 +1141,7 @@ Insights gathered so far:
 {context.get_insights_summary()}
 
 Previous searches:
-{chr(10).join(f'- {q}' for q in context.search_history)}
+{context.get_history_text()}
 
 What information is still missing to fully answer the original question?
 Generate 1-2 follow-up search queries that would help fill these gaps.
@@ -733,24 +1154,28 @@ Format:
 If the research seems complete, respond with: COMPLETE"""
 
         try:
-            response = self.llm.invoke(prompt)
-
-            if "COMPLETE" in response.content.upper():
-                return []
+            response = await self._semantic_invoke("follow_ups", context, prompt)
 
-            follow_ups = []
-            for line in response.content.strip().split("\n"):
-                line = line.strip()
-                if line and line[0].isdigit():
-                    query = line.lstrip("0123456789.)-] ").strip()
-                    if query and query not in context.search_history:
-                        follow_ups.append(query)
-
-            return follow_ups[:2]
+            return self._parse_follow_ups(response, context)
         except Exception as e:
             logger.error(f"Follow-up generation failed: {e}")
             return []
 
+    def _parse_follow_ups(self, llm_response: str, context: ResearchContext) -> list[str]:
+        """Parse numbered follow-up queries from an LLM response ([] if COMPLETE)."""
+        if "COMPLETE" in llm_response.upper():
+            return []
+
+        follow_ups = []
+        for line in llm_response.strip().split("\n"):
+            line = line.strip()
+            if line and line[0].isdigit():
+                query = _LEAD_RE.sub("", line, 1).strip()
+                if query and query not in context.search_history:
+                    follow_ups.append(query)
+
+        return follow_ups[:2]
+
     def _is_research_complete(self, context: ResearchContext) -> bool:
         """
         Determine if we have gathered enough insights.
@@ -767,18 +1192,19 @@ If the research seems complete, respond with: COMPLETE"""
         # Continue if we haven't hit max depth
         return False
 
-    def _synthesize_report(self, context: ResearchContext) -> str:
+    async def _synthesize_report(self, context: ResearchContext) -> str:
         """
         Synthesize all insights into a comprehensive research report.
         """
         if not context.insights:
             return "No insights were gathered during research. Try a different query."
 
+        # Highest-confidence insights first, capped to keep the prompt bounded
+        top_insights = heapq.nlargest(
+            MAX_REPORT_INSIGHTS, context.insights, key=attrgetter("confidence")
+        )
         insights_text = "\n".join(
-            [
-                f"- {i.content} (confidence: {i.confidence:.1f})"
-                for i in sorted(context.insights, key=lambda x: x.confidence, reverse=True)
-            ]
+            f"- {i.content} (confidence: {i.confidence:.1f})" for i in top_insights
         )
 
         prompt = f"""You are a groundwater science expert synthesizing research findings.
@@ -800,8 +1226,7 @@ Structure your response with:
 Be informative, accurate, and cite the level of confidence where relevant."""
 
         try:
-            response = self.llm.invoke(prompt)
-            return response.content
+            return await self._ainvoke(prompt)
         except Exception as e:
             logger.error(f"Report synthesis failed: {e}")
             return f"Research gathered {len(context.insights)} insights but synthesis failed: {e}"
@@ -33,8 +33,9 @@ Example:
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -225,12 +226,148 @@ UNTRUSTED_PATTERNS = [
     r"youtube\.com",  # Unless official channel
 ]
 
+_UNTRUSTED_RES = [re.compile(pattern) for pattern in UNTRUSTED_PATTERNS]
+
 
 # =============================================================================
 # VERIFICATION FUNCTIONS
 # =============================================================================
 
 
+@lru_cache(maxsize=4096)
+def _verify_domain(domain: str) -> SourceVerification:
+    """
+    Trust assessment for a domain (cached; the url field is left empty).
+
+    Everything after the untrusted-pattern check depends only on the domain,
+    so repeated hosts such as usgs.gov or epa.gov are classified once.
+    """
+    # Priority 1: Check NUMERICAL DATA sources (highest value)
+    for num_domain, (org, desc) in NUMERICAL_DATA_DOMAINS.items():
+        if domain.endswith(num_domain) or domain == num_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.VERIFIED,
+                source_type="numerical_data_api",
+                organization=org,
+                is_approved=True,
+                reason=f"📊 NUMERICAL DATA: {desc}",
+                category=SourceCategory.NUMERICAL_DATA,
+                priority_score=1.0,
+            )
+
+    # Priority 2: Check RESEARCH PAPER sources
+    for research_domain, (org, desc) in RESEARCH_PAPER_DOMAINS.items():
+        if domain.endswith(research_domain) or domain == research_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.VERIFIED,
+                source_type="peer_reviewed",
+                organization=org,
+                is_approved=True,
+                reason=f"📄 RESEARCH PAPER: {desc}",
+                category=SourceCategory.RESEARCH_PAPER,
+                priority_score=0.95,
+            )
+
+    # Priority 3: Check GOVERNMENT REPORT sources
+    for gov_domain, (org, desc) in GOVERNMENT_REPORT_DOMAINS.items():
+        if domain.endswith(gov_domain) or domain == gov_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.VERIFIED,
+                source_type="government_report",
+                organization=org,
+                is_approved=True,
+                reason=f"🏛️ GOVERNMENT: {desc}",
+                category=SourceCategory.GOVERNMENT_REPORT,
+                priority_score=0.9,
+            )
+
+    # Priority 4: Check ACADEMIC sources
+    for academic_domain, (org, desc) in ACADEMIC_DOMAINS.items():
+        if domain.endswith(academic_domain) or domain == academic_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.TRUSTED,
+                source_type="academic",
+                organization=org,
+                is_approved=True,
+                reason=f"🎓 ACADEMIC: {desc}",
+                category=SourceCategory.ACADEMIC,
+                priority_score=0.85,
+            )
+
+    # Priority 5: Check REFERENCE sources
+    for ref_domain, (org, desc) in REFERENCE_DOMAINS.items():
+        if domain.endswith(ref_domain) or domain == ref_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.MODERATE,
+                source_type="reference",
+                organization=org,
+                is_approved=True,
+                reason=f"📚 REFERENCE: {desc}",
+                category=SourceCategory.REFERENCE,
+                priority_score=0.6,
+            )
+
+    # Legacy checks for backward compatibility
+    # Check verified domains
+    for verified_domain, (org, desc) in VERIFIED_DOMAINS.items():
+        if domain.endswith(verified_domain) or domain == verified_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.VERIFIED,
+                source_type="government/scientific",
+                organization=org,
+                is_approved=True,
+                reason=desc,
+                category=SourceCategory.GOVERNMENT_REPORT,
+                priority_score=0.9,
+            )
+
+    # Check trusted domains
+    for trusted_domain, (org, desc) in TRUSTED_DOMAINS.items():
+        if domain.endswith(trusted_domain) or domain == trusted_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.TRUSTED,
+                source_type="academic/research",
+                organization=org,
+                is_approved=True,
+                reason=desc,
+                category=SourceCategory.ACADEMIC,
+                priority_score=0.85,
+            )
+
+    # Check moderate domains
+    for mod_domain, (org, desc) in MODERATE_DOMAINS.items():
+        if domain.endswith(mod_domain) or domain == mod_domain:
+            return SourceVerification(
+                url="",
+                trust_level=TrustLevel.MODERATE,
+                source_type="reference",
+                organization=org,
+                is_approved=True,  # Allowed but flagged
+                reason=desc,
+                category=SourceCategory.REFERENCE,
+                priority_score=0.6,
+            )
+
+    # Unknown source - NOT APPROVED by default
+    return SourceVerification(
+        url="",
+        trust_level=TrustLevel.UNKNOWN,
+        source_type="unknown",
+        organization="Unknown",
+        is_approved=False,
+        reason="⚠️ Source not in verified list - requires numerical data or research paper",
+        category=SourceCategory.UNKNOWN,
+        priority_score=0.0,
+    )
+
+
 def verify_source(url: str) -> SourceVerification:
     """
     Verify if a source URL is trusted for groundwater research.
@@ -269,143 +406,21 @@ def verify_source(url: str) -> SourceVerification:
             domain = domain[4:]
 
         # Check for untrusted patterns first
-        for pattern in UNTRUSTED_PATTERNS:
-            if re.search(pattern, url.lower()):
+        url_lower = url.lower()
+        for pattern in _UNTRUSTED_RES:
+            if pattern.search(url_lower):
                 return SourceVerification(
                     url=url,
                     trust_level=TrustLevel.UNTRUSTED,
                     source_type="social/blog",
                     organization="Unknown",
                     is_approved=False,
-                    reason=f"Source matches untrusted pattern: {pattern}",
+                    reason=f"Source matches untrusted pattern: {pattern.pattern}",
                     category=SourceCategory.BLOG,
                     priority_score=0.0,
                 )
 
-        # Priority 1: Check NUMERICAL DATA sources (highest value)
-        for num_domain, (org, desc) in NUMERICAL_DATA_DOMAINS.items():
-            if domain.endswith(num_domain) or domain == num_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.VERIFIED,
-                    source_type="numerical_data_api",
-                    organization=org,
-                    is_approved=True,
-                    reason=f"📊 NUMERICAL DATA: {desc}",
-                    category=SourceCategory.NUMERICAL_DATA,
-                    priority_score=1.0,
-                )
-
-        # Priority 2: Check RESEARCH PAPER sources
-        for research_domain, (org, desc) in RESEARCH_PAPER_DOMAINS.items():
-            if domain.endswith(research_domain) or domain == research_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.VERIFIED,
-                    source_type="peer_reviewed",
-                    organization=org,
-                    is_approved=True,
-                    reason=f"📄 RESEARCH PAPER: {desc}",
-                    category=SourceCategory.RESEARCH_PAPER,
-                    priority_score=0.95,
-                )
-
-        # Priority 3: Check GOVERNMENT REPORT sources
-        for gov_domain, (org, desc) in GOVERNMENT_REPORT_DOMAINS.items():
-            if domain.endswith(gov_domain) or domain == gov_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.VERIFIED,
-                    source_type="government_report",
-                    organization=org,
-                    is_approved=True,
-                    reason=f"🏛️ GOVERNMENT: {desc}",
-                    category=SourceCategory.GOVERNMENT_REPORT,
-                    priority_score=0.9,
-                )
-
-        # Priority 4: Check ACADEMIC sources
-        for academic_domain, (org, desc) in ACADEMIC_DOMAINS.items():
-            if domain.endswith(academic_domain) or domain == academic_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.TRUSTED,
-                    source_type="academic",
-                    organization=org,
-                    is_approved=True,
-                    reason=f"🎓 ACADEMIC: {desc}",
-                    category=SourceCategory.ACADEMIC,
-                    priority_score=0.85,
-                )
-
-        # Priority 5: Check REFERENCE sources
-        for ref_domain, (org, desc) in REFERENCE_DOMAINS.items():
-            if domain.endswith(ref_domain) or domain == ref_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.MODERATE,
-                    source_type="reference",
-                    organization=org,
-                    is_approved=True,
-                    reason=f"📚 REFERENCE: {desc}",
-                    category=SourceCategory.REFERENCE,
-                    priority_score=0.6,
-                )
-
-        # Legacy checks for backward compatibility
-        # Check verified domains
-        for verified_domain, (org, desc) in VERIFIED_DOMAINS.items():
-            if domain.endswith(verified_domain) or domain == verified_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.VERIFIED,
-                    source_type="government/scientific",
-                    organization=org,
-                    is_approved=True,
-                    reason=desc,
-                    category=SourceCategory.GOVERNMENT_REPORT,
-                    priority_score=0.9,
-                )
-
-        # Check trusted domains
-        for trusted_domain, (org, desc) in TRUSTED_DOMAINS.items():
-            if domain.endswith(trusted_domain) or domain == trusted_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.TRUSTED,
-                    source_type="academic/research",
-                    organization=org,
-                    is_approved=True,
-                    reason=desc,
-                    category=SourceCategory.ACADEMIC,
-                    priority_score=0.85,
-                )
-
-        # Check moderate domains
-        for mod_domain, (org, desc) in MODERATE_DOMAINS.items():
-            if domain.endswith(mod_domain) or domain == mod_domain:
-                return SourceVerification(
-                    url=url,
-                    trust_level=TrustLevel.MODERATE,
-                    source_type="reference",
-                    organization=org,
-                    is_approved=True,  # Allowed but flagged
-                    reason=desc,
-                    category=SourceCategory.REFERENCE,
-                    priority_score=0.6,
-                )
-
-        # Unknown source - NOT APPROVED by default
-        return SourceVerification(
-            url=url,
-            trust_level=TrustLevel.UNKNOWN,
-            source_type="unknown",
-            organization="Unknown",
-            is_approved=False,
-            reason="⚠️ Source not in verified list - requires numerical data or research paper",
-            category=SourceCategory.UNKNOWN,
-            priority_score=0.0,
-        )
+        return replace(_verify_domain(domain), url=url)
 
     except Exception as e:
         return SourceVerification(
@@ -30,24 +30,61 @@ Example:
 The LLM uses all this accumulated knowledge to answer questions.
 """
 
+import asyncio
+import json
 import logging
 import sys
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directories to path for imports
 ROOT_DIR = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 sys.path.insert(0, str(ROOT_DIR / "src"))
 
-from src.agent.knowledge import add_document, get_knowledge_stats
+from src.agent.knowledge import add_documents_bulk, bulk_ingest_mode, get_knowledge_stats
 from src.agent.source_verification import verify_source
 
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# urllib3 and aiohttp decode Brotli responses only when this is installed
+try:
+    import brotli  # noqa: F401
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -116,6 +153,59 @@ FLORIDA_AQUIFER_SITES = {
 }
 
 
+USGS_GWLEVELS_URL = "https://waterservices.usgs.gov/nwis/gwlevels/"
+
+# Ask for compressed JSON (it shrinks several-fold) and identify the client
+USGS_HEADERS = {
+    "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
+    "User-Agent": "GroundwaterGPT/1.0 (+https://github.com/walatheo/GroundwaterGPT)",
+}
+
+# Concurrent USGS requests, overall request rate, and retries on 429/5xx
+USGS_MAX_CONCURRENCY = 8
+USGS_REQUESTS_PER_SECOND = 5
+USGS_MAX_RETRIES = 3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# On-disk USGS response cache (under data_dir). History older than the
+# recent window is immutable and cached per month-aligned date range; the
+# recent window is refetched once it is older than USGS_RECENT_TTL seconds.
+USGS_CACHE_DIRNAME = ".usgs_cache"
+USGS_RECENT_DAYS = 30
+USGS_RECENT_TTL = 86400
+
+# Documents written to the knowledge base per vectorstore call
+CHROMA_BATCH_SIZE = 100
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, with orjson when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode JSON to bytes, with orjson when it is installed."""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode()
+
+
+class _RateLimiter:
+    """Spaces request starts so at most ``rate`` begin per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
 @dataclass
 class LearningStats:
     """Track continuous learning statistics."""
@@ -147,23 +237,173 @@ class ContinuousLearner:
         self,
         data_dir: str = "data",
         days_of_history: int = 365 * 10,  # 10 years default
+        write_site_csv: bool = True,
+        fast_ingest: bool = False,
     ):
         """Initialize the continuous learner.
 
         Args:
             data_dir: Directory to store downloaded data
             days_of_history: How many days of historical data to fetch
+            write_site_csv: Also write a usgs_<site>.csv per site (read by the UI and API)
+            fast_ingest: Write batches with relaxed SQLite durability (see bulk_ingest_mode)
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.days_of_history = days_of_history
+        self.write_site_csv = write_site_csv
+        self.fast_ingest = fast_ingest
         self.stats = LearningStats()
+        self._usgs_requests = 0
+        self._window_dates = None
+
+        # Pooled keep-alive connections for the sequential USGS path
+        self._session = requests.Session()
+        self._session.headers.update(USGS_HEADERS)
+        retries = Retry(
+            total=USGS_MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=sorted(_RETRY_STATUSES),
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        )
+
+    def _usgs_window_dates(self) -> tuple[str, list]:
+        """Date strings for the request windows, formatted once per day.
+
+        Window starts are aligned to the first of the month so the historical
+        window keeps the same cache key between daily runs.
+
+        Returns:
+            (start date, [(startDT, endDT, is_recent)]) as YYYY-MM-DD strings
+        """
+        end_date = datetime.now()
+        today = end_date.date()
+        if self._window_dates is not None and self._window_dates[0] == today:
+            return self._window_dates[1]
+
+        start_date = end_date - timedelta(days=self.days_of_history)
+        window_start = start_date.replace(day=1)
+        recent_start = max(
+            window_start, (end_date - timedelta(days=USGS_RECENT_DAYS)).replace(day=1)
+        )
+
+        windows = []
+        if window_start < recent_start:
+            hist_end = recent_start - timedelta(days=1)
+            windows.append(
+                (window_start.strftime("%Y-%m-%d"), hist_end.strftime("%Y-%m-%d"), False)
+            )
+        windows.append((recent_start.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"), True))
+
+        result = (start_date.strftime("%Y-%m-%d"), windows)
+        self._window_dates = (today, result)
+        return result
+
+    def _usgs_windows(self, site_no: str) -> tuple[str, list]:
+        """Split the requested history into cacheable request windows.
+
+        Returns:
+            (start date as YYYY-MM-DD, [(params, cache_path, ttl_seconds)]);
+            a ttl of None means the entry never expires
+        """
+        since, dates = self._usgs_window_dates()
+        cache_dir = self.data_dir / USGS_CACHE_DIRNAME
+
+        windows = []
+        for start, end, recent in dates:
+            params = {"format": "json", "sites": site_no, "startDT": start, "endDT": end}
+            if recent:
+                windows.append(
+                    (params, cache_dir / f"{site_no}_{start}_recent.json", USGS_RECENT_TTL)
+                )
+            else:
+                windows.append((params, cache_dir / f"{site_no}_{start}_{end}.json", None))
+
+        return since, windows
+
+    @staticmethod
+    def _load_usgs_cache(path: Path, ttl: float | None) -> dict | None:
+        """Return a cached USGS payload, or None if missing or expired."""
+        try:
+            if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+                return None
+            return _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _store_usgs_cache(site_no: str, path: Path, data: dict) -> None:
+        """Write a USGS payload to the cache and drop superseded entries."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(_json_dumps(data))
+            tmp_path.replace(path)
+
+            recent = path.stem.endswith("_recent")
+            for stale in path.parent.glob(f"{site_no}_*.json"):
+                if stale != path and stale.stem.endswith("_recent") == recent:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not cache USGS response for {site_no}: {e}")
+
+    @staticmethod
+    def _parse_usgs_response(
+        payloads: list[dict], site_no: str, site_name: str, aquifer: str, since: str = ""
+    ) -> pd.DataFrame | None:
+        """Convert USGS gwlevels JSON payloads into one DataFrame.
+
+        Values dated before ``since`` (YYYY-MM-DD) are dropped.
+        """
+        time_series = [
+            ts for data in payloads for ts in data.get("value", {}).get("timeSeries", [])
+        ]
+        if not time_series:
+            logger.warning(f"No data found for site {site_no}")
+            return None
+
+        dates = []
+        values = []
+        for ts in time_series:
+            for v in ts.get("values", [{}])[0].get("value", []):
+                date = v.get("dateTime")
+                if since and (date or since) < since:
+                    continue
+                dates.append(date)
+                values.append(v.get("value", 0))
+
+        if dates:
+            # Per-site constants are single-category columns sharing one code array
+            codes = np.zeros(len(dates), dtype=np.int8)
+
+            def constant(value: str) -> pd.Categorical:
+                return pd.Categorical.from_codes(codes, categories=[value])
+
+            df = pd.DataFrame(
+                {
+                    "site_no": constant(site_no),
+                    "site_name": constant(site_name),
+                    "aquifer": constant(aquifer),
+                    "datetime": pd.to_datetime(dates, format="ISO8601"),
+                    "value": np.asarray(values, dtype=np.float32),
+                    "unit": constant("ft below land surface"),
+                }
+            )
+            logger.info(f"  ✅ Retrieved {len(df)} records for {site_no}")
+            return df
+
+        return None
 
     def fetch_usgs_site_data(
         self, site_no: str, site_name: str, aquifer: str
     ) -> pd.DataFrame | None:
         """Fetch groundwater data from a USGS site.
 
+        Responses are cached on disk under data_dir (see USGS_CACHE_DIRNAME),
+        so repeated runs only request the recent window from USGS.
+
         Args:
             site_no: USGS site number
             site_name: Human-readable site name
@@ -172,57 +412,149 @@ class ContinuousLearner:
         Returns:
             DataFrame with groundwater data, or None if failed
         """
-        logger.info(f"📡 Fetching data for {site_name} ({site_no})...")
-
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=self.days_of_history)
-
-        url = "https://waterservices.usgs.gov/nwis/gwlevels/"
-        params = {
-            "format": "json",
-            "sites": site_no,
-            "startDT": start_date.strftime("%Y-%m-%d"),
-            "endDT": end_date.strftime("%Y-%m-%d"),
-        }
+        since, windows = self._usgs_windows(site_no)
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse the USGS JSON response
-            time_series = data.get("value", {}).get("timeSeries", [])
-            if not time_series:
-                logger.warning(f"No data found for site {site_no}")
-                return None
+            payloads = []
+            for params, path, ttl in windows:
+                data = self._load_usgs_cache(path, ttl)
+                if data is None:
+                    logger.info(f"📡 Fetching data for {site_name} ({site_no})...")
+                    self._usgs_requests += 1
+                    response = self._session.get(USGS_GWLEVELS_URL, params=params, timeout=30)
+                    response.raise_for_status()
+                    data = _json_loads(response.content)
+                    self._store_usgs_cache(site_no, path, data)
+                payloads.append(data)
+            return self._parse_usgs_response(payloads, site_no, site_name, aquifer, since)
+        except Exception as e:
+            logger.error(f"  ❌ Error fetching {site_no}: {e}")
+            self.stats.errors.append(f"{site_no}: {str(e)}")
 
-            records = []
-            for ts in time_series:
-                values = ts.get("values", [{}])[0].get("value", [])
-                for v in values:
-                    records.append(
-                        {
-                            "site_no": site_no,
-                            "site_name": site_name,
-                            "aquifer": aquifer,
-                            "datetime": v.get("dateTime"),
-                            "value": float(v.get("value", 0)),
-                            "unit": "ft below land surface",
-                        }
-                    )
+        return None
 
-            if records:
-                df = pd.DataFrame(records)
-                df["datetime"] = pd.to_datetime(df["datetime"])
-                logger.info(f"  ✅ Retrieved {len(df)} records")
-                return df
+    async def _get_usgs_json(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        limiter: _RateLimiter,
+        params: dict,
+    ) -> dict:
+        """GET one USGS window, retrying 429/5xx and connection errors with backoff."""
+        async with semaphore:
+            for attempt in range(USGS_MAX_RETRIES + 1):
+                retry = attempt < USGS_MAX_RETRIES
+                await limiter.acquire()
+                try:
+                    async with session.get(USGS_GWLEVELS_URL, params=params) as response:
+                        if not (retry and response.status in _RETRY_STATUSES):
+                            response.raise_for_status()
+                            return _json_loads(await response.read())
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if not retry:
+                        raise
+                await asyncio.sleep(2**attempt)
+
+    async def _fetch_usgs_site_data(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        limiter: _RateLimiter,
+        site_no: str,
+        site_name: str,
+        aquifer: str,
+    ) -> pd.DataFrame | None:
+        """Async variant of ``fetch_usgs_site_data``."""
+        since, windows = self._usgs_windows(site_no)
 
+        try:
+            payloads = []
+            for params, path, ttl in windows:
+                data = self._load_usgs_cache(path, ttl)
+                if data is None:
+                    logger.info(f"📡 Fetching data for {site_name} ({site_no})...")
+                    data = await self._get_usgs_json(session, semaphore, limiter, params)
+                    self._store_usgs_cache(site_no, path, data)
+                payloads.append(data)
+            return self._parse_usgs_response(payloads, site_no, site_name, aquifer, since)
         except Exception as e:
             logger.error(f"  ❌ Error fetching {site_no}: {e}")
             self.stats.errors.append(f"{site_no}: {str(e)}")
 
         return None
 
+    async def _fetch_all_sites_async(self) -> list:
+        """Fetch every configured site concurrently, in configuration order."""
+        semaphore = asyncio.Semaphore(USGS_MAX_CONCURRENCY)
+        limiter = _RateLimiter(USGS_REQUESTS_PER_SECOND)
+        connector = aiohttp.TCPConnector(limit_per_host=USGS_MAX_CONCURRENCY)
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        pairs = [
+            (aquifer_name, site)
+            for aquifer_name, aquifer_info in FLORIDA_AQUIFER_SITES.items()
+            for site in aquifer_info["sites"]
+        ]
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=USGS_HEADERS
+        ) as session:
+            frames = await asyncio.gather(
+                *(
+                    self._fetch_usgs_site_data(
+                        session, semaphore, limiter, site["site_no"], site["name"], aquifer_name
+                    )
+                    for aquifer_name, site in pairs
+                )
+            )
+        return [(aquifer_name, site, df) for (aquifer_name, site), df in zip(pairs, frames)]
+
+    def _fetch_all_sites(self) -> list:
+        """Fetch every configured site, sequentially when aiohttp is missing."""
+        if AIOHTTP_AVAILABLE:
+            return asyncio.run(self._fetch_all_sites_async())
+
+        results = []
+        for aquifer_name, aquifer_info in FLORIDA_AQUIFER_SITES.items():
+            logger.info(f"\n📍 {aquifer_info['description']}")
+            for site in aquifer_info["sites"]:
+                requests_before = self._usgs_requests
+                df = self.fetch_usgs_site_data(site["site_no"], site["name"], aquifer_name)
+                results.append((aquifer_name, site, df))
+                # Be nice to USGS servers (no pause when served from cache)
+                if self._usgs_requests != requests_before:
+                    time.sleep(1)
+        return results
+
+    def _flush_documents(self, pending: list) -> int:
+        """Write queued (content, metadata, source_url, doc_id) documents in one batch.
+
+        Args:
+            pending: Queued documents; cleared once written
+
+        Returns:
+            Number of documents added
+        """
+        if not pending:
+            return 0
+
+        contents, metadatas, source_urls, ids = map(list, zip(*pending))
+        pending.clear()
+        try:
+            # Opt-in: the ingest is re-runnable, so per-commit durability can go
+            with bulk_ingest_mode() if self.fast_ingest else nullcontext():
+                added = add_documents_bulk(
+                    contents,
+                    metadatas,
+                    source_urls,
+                    require_verification=False,  # callers queue verified sources only
+                    ids=ids,
+                )
+            logger.info(f"  📚 Added {added} documents to knowledge base")
+            return added
+        except Exception as e:
+            logger.error(f"  ❌ Failed to add to KB: {e}")
+            return 0
+
     def add_usgs_data_to_knowledge_base(
         self, df: pd.DataFrame, site_info: dict, aquifer_name: str
     ) -> int:
@@ -236,7 +568,20 @@ class ContinuousLearner:
         Returns:
             Number of documents added
         """
-        added = 0
+        return self._flush_documents([self._build_usgs_summary(df, site_info, aquifer_name)])
+
+    def _build_usgs_summary(
+        self, df: pd.DataFrame, site_info: dict, aquifer_name: str
+    ) -> tuple[str, dict, str, str]:
+        """Build the knowledge-base document for one site.
+
+        The document id is per site, so each run replaces the site's summary.
+
+        Returns:
+            (summary, metadata, source_url, doc_id) ready for ``_flush_documents``
+        """
+        dates = df["datetime"]
+        data_start, data_end = dates.min(), dates.max()
 
         # Create a summary document for this site
         summary = f"""USGS Groundwater Monitoring Data Summary
@@ -246,7 +591,7 @@ Site Number: {site_info['site_no']}
 County: {site_info.get('county', 'Unknown')}
 Aquifer: {aquifer_name.replace('_', ' ').title()}
 
-Data Period: {df['datetime'].min().strftime('%Y-%m-%d')} to {df['datetime'].max().strftime('%Y-%m-%d')}
+Data Period: {data_start.strftime('%Y-%m-%d')} to {data_end.strftime('%Y-%m-%d')}
 Total Records: {len(df)}
 
 Statistics:
@@ -258,16 +603,19 @@ Statistics:
 Annual Averages:
 """
         # Add annual averages
-        df["year"] = df["datetime"].dt.year
-        annual = df.groupby("year")["value"].mean()
-        for year, avg in annual.items():
-            summary += f"- {year}: {avg:.2f} ft\n"
-
-        # Calculate trend
-        if len(annual) > 1:
-            years = annual.index.values
-            values = annual.values
-            slope = (values[-1] - values[0]) / (years[-1] - years[0])
+        years = dates.dt.year.to_numpy()
+        offsets = years - years.min()
+        counts = np.bincount(offsets)
+        sums = np.bincount(offsets, weights=df["value"].to_numpy())
+        present = counts > 0
+        annual_years = np.flatnonzero(present) + years.min()
+        annual_avgs = sums[present] / counts[present]
+        summary += "".join(f"- {y}: {a:.2f} ft\n" for y, a in zip(annual_years, annual_avgs))
+
+        # Calculate trend (least-squares fit over the annual averages)
+        if len(annual_years) > 1:
+            slope = np.polyfit(annual_years, annual_avgs, 1)[0]
+            # Values are depth below land surface, so a rising depth is a falling level
             trend = "declining" if slope > 0 else "rising"
             summary += f"\nTrend: Water levels are {trend} at {abs(slope):.3f} ft/year"
 
@@ -278,31 +626,24 @@ Annual Averages:
             "site_name": site_info["name"],
             "county": site_info.get("county", "Unknown"),
             "aquifer": aquifer_name,
-            "data_start": df["datetime"].min().isoformat(),
-            "data_end": df["datetime"].max().isoformat(),
+            "data_start": data_start.isoformat(),
+            "data_end": data_end.isoformat(),
             "record_count": len(df),
             "source": "USGS NWIS",
             "verified": True,
         }
 
-        try:
-            success = add_document(
-                content=summary,
-                metadata=metadata,
-                source_url=f"https://waterdata.usgs.gov/nwis/uv?site_no={site_info['site_no']}",
-                require_verification=False,  # USGS is pre-verified
-            )
-            if success:
-                added += 1
-                logger.info(f"  📚 Added summary to knowledge base")
-        except Exception as e:
-            logger.error(f"  ❌ Failed to add to KB: {e}")
-
-        return added
+        # USGS is pre-verified
+        source_url = f"https://waterdata.usgs.gov/nwis/uv?site_no={site_info['site_no']}"
+        return summary, metadata, source_url, f"usgs:{site_info['site_no']}"
 
     def fetch_all_florida_aquifer_data(self) -> LearningStats:
         """Fetch data from all configured Florida aquifer sites.
 
+        Combined records are streamed one site at a time into
+        all_florida_aquifers.parquet when pyarrow is available, or appended to
+        all_florida_aquifers.csv otherwise.
+
         Returns:
             Learning statistics
         """
@@ -310,36 +651,54 @@ Annual Averages:
         logger.info("🌊 Starting Florida Aquifer Data Collection...")
         logger.info(f"   Configured aquifers: {len(FLORIDA_AQUIFER_SITES)}")
 
-        all_data = []
-
-        for aquifer_name, aquifer_info in FLORIDA_AQUIFER_SITES.items():
-            logger.info(f"\n📍 {aquifer_info['description']}")
-
-            for site in aquifer_info["sites"]:
-                df = self.fetch_usgs_site_data(site["site_no"], site["name"], aquifer_name)
-
-                if df is not None and len(df) > 0:
-                    # Save to CSV
-                    csv_path = self.data_dir / f"usgs_{site['site_no']}.csv"
-                    df.to_csv(csv_path, index=False)
+        pending = []
+        writer = None
+        total_records = 0
 
-                    # Add to knowledge base
-                    docs_added = self.add_usgs_data_to_knowledge_base(df, site, aquifer_name)
+        try:
+            for aquifer_name, site, df in self._fetch_all_sites():
+                if df is None or len(df) == 0:
+                    continue
+
+                csv_path = self.data_dir / f"usgs_{site['site_no']}.csv"
+                if PYARROW_AVAILABLE:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    if self.write_site_csv:
+                        pacsv.write_csv(table, str(csv_path))
+                    if writer is None:
+                        writer = pq.ParquetWriter(
+                            self.data_dir / "all_florida_aquifers.parquet",
+                            table.schema,
+                            compression="zstd",
+                        )
+                    writer.write_table(table.cast(writer.schema))
+                else:
+                    if self.write_site_csv:
+                        df.to_csv(csv_path, index=False)
+                    # Replace any previous run's file on the first site, then append
+                    df.to_csv(
+                        self.data_dir / "all_florida_aquifers.csv",
+                        index=False,
+                        mode="a" if total_records else "w",
+                        header=not total_records,
+                    )
+                total_records += len(df)
 
-                    self.stats.documents_added += docs_added
-                    self.stats.usgs_records_added += len(df)
-                    self.stats.sites_processed += 1
+                # Queue for the knowledge base
+                pending.append(self._build_usgs_summary(df, site, aquifer_name))
+                if len(pending) >= CHROMA_BATCH_SIZE:
+                    self.stats.documents_added += self._flush_documents(pending)
 
-                    all_data.append(df)
+                self.stats.usgs_records_added += len(df)
+                self.stats.sites_processed += 1
+        finally:
+            if writer is not None:
+                writer.close()
 
-                # Be nice to USGS servers
-                time.sleep(1)
+        self.stats.documents_added += self._flush_documents(pending)
 
-        # Combine all data
-        if all_data:
-            combined = pd.concat(all_data, ignore_index=True)
-            combined.to_csv(self.data_dir / "all_florida_aquifers.csv", index=False)
-            logger.info(f"\n💾 Saved combined data: {len(combined)} total records")
+        if total_records:
+            logger.info(f"\n💾 Saved combined data: {total_records} total records")
 
         self.stats.end_time = datetime.now()
         return self.stats
@@ -354,6 +713,7 @@ Annual Averages:
             Number of papers added
         """
         added = 0
+        pending = []
 
         for paper in papers:
             # Verify the source
@@ -384,19 +744,12 @@ Keywords: {', '.join(paper.get('keywords', []))}
                 "trust_level": verification.trust_level.value,
             }
 
-            try:
-                success = add_document(
-                    content=content,
-                    metadata=metadata,
-                    source_url=paper.get("url", ""),
-                    require_verification=False,
-                )
-                if success:
-                    added += 1
-            except Exception as e:
-                logger.error(f"Failed to add paper: {e}")
+            url = paper.get("url", "")
+            pending.append((content, metadata, url, f"paper:{url}" if url else None))
+            if len(pending) >= CHROMA_BATCH_SIZE:
+                added += self._flush_documents(pending)
 
-        return added
+        return added + self._flush_documents(pending)
 
     def get_learning_status(self) -> dict:
         """Get current knowledge base status."""
@@ -413,17 +766,19 @@ Keywords: {', '.join(paper.get('keywords', []))}
 def run_continuous_learning(
     include_usgs: bool = True,
     days_of_history: int = 365 * 10,
+    fast_ingest: bool = False,
 ) -> dict:
     """Run a continuous learning cycle.
 
     Args:
         include_usgs: Whether to fetch USGS data
         days_of_history: Days of historical data to fetch
+        fast_ingest: Write with relaxed SQLite durability (see bulk_ingest_mode)
 
     Returns:
         Learning statistics
     """
-    learner = ContinuousLearner(days_of_history=days_of_history)
+    learner = ContinuousLearner(days_of_history=days_of_history, fast_ingest=fast_ingest)
 
     results = {"usgs": None, "papers": None}
 
@@ -451,6 +806,11 @@ if __name__ == "__main__":
     parser.add_argument("--usgs", action="store_true", default=True, help="Fetch USGS data")
     parser.add_argument("--days", type=int, default=3650, help="Days of history to fetch")
     parser.add_argument("--status", action="store_true", help="Show current learning status")
+    parser.add_argument(
+        "--fast-ingest",
+        action="store_true",
+        help="Relax SQLite durability while writing (re-run the ingest after a crash)",
+    )
 
     args = parser.parse_args()
 
@@ -465,6 +825,7 @@ if __name__ == "__main__":
         results = run_continuous_learning(
             include_usgs=args.usgs,
             days_of_history=args.days,
+            fast_ingest=args.fast_ingest,
         )
 
         print("\n" + "=" * 60)
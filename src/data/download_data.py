@@ -3,18 +3,31 @@
 
 Downloads:
 1. Real groundwater data from USGS National Water Information System (NWIS)
-2. ERA5 climate data from Copernicus CDS (optional)
+2. ERA5 climate data from Copernicus CDS (optional; needs cdsapi, xarray, h5netcdf)
 
 Usage:
     python download_data.py              # Download USGS groundwater (default)
     python download_data.py --climate    # Also download ERA5 climate data
     python download_data.py --site SITE  # Specify USGS site ID
+    python download_data.py --climate --concurrency 2  # Limit parallel CDS requests
 """
 
 import argparse
+import asyncio
+import csv
+import importlib.util
+import io
+import logging
+import math
+import os
+import shutil
 import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -23,6 +36,17 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from config import ACTIVE_REGION, CDS_API_KEY, CDS_URL, DATA_DIR, REGIONS, TIME_CONFIG  # noqa: E402
 
+# Check for pyarrow (Parquet output and fast CSV writer)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # USGS CONFIGURATION
 # =============================================================================
@@ -221,100 +245,323 @@ def search_usgs_sites(
 # ERA5 CLIMATE DATA (OPTIONAL)
 # =============================================================================
 
+# Maximum concurrent CDS requests (ECMWF fair-use limit)
+MAX_CDS_CONCURRENCY = 4
+
+# NetCDF engine, chosen once here instead of probing engines per file
+ERA5_ENGINE = "h5netcdf" if importlib.util.find_spec("h5netcdf") else "netcdf4"
+
+# Open ERA5 files lazily in monthly chunks when dask is installed so the
+# spatial mean streams through memory instead of materializing full arrays
+ERA5_CHUNKS = {"time": 30} if importlib.util.find_spec("dask") else None
+
+# Per-year ERA5 cache (raw NetCDF + processed Parquet)
+CACHE_DIR = DATA_DIR / "era5_cache"
+
+# Native ERA5 single-levels grid spacing (degrees)
+ERA5_GRID = 0.25
+
+# Invariant part of every ERA5 request; only year and area change per call
+ERA5_REQUEST = {
+    "product_type": "reanalysis",
+    "variable": ["2m_temperature", "total_precipitation"],
+    "month": [f"{m:02d}" for m in range(1, 13)],
+    "day": [f"{d:02d}" for d in range(1, 32)],
+    "time": ["12:00"],
+    "grid": [ERA5_GRID, ERA5_GRID],
+    "data_format": "netcdf",
+    "download_format": "unarchived",
+}
+
+
+@lru_cache(maxsize=1)
+def _cds_xr():
+    """Import the optional ERA5 dependencies once and return (cdsapi, xarray)."""
+    import cdsapi
+    import xarray as xr
+
+    return cdsapi, xr
 
+
+@lru_cache(maxsize=1)
 def setup_cds_credentials():
-    """Setup CDS API credentials."""
+    """Setup CDS API credentials (checked once per process).
+
+    The file is written to a temporary name and renamed into place so an
+    interrupted or concurrent run never leaves a truncated ~/.cdsapirc. It
+    is created owner-only, since it holds the API key.
+    """
     cdsapi_rc = Path.home() / ".cdsapirc"
     if not cdsapi_rc.exists():
-        cdsapi_rc.write_text(f"url: {CDS_URL}\nkey: {CDS_API_KEY}\n")
+        tmp = cdsapi_rc.with_name(f"{cdsapi_rc.name}.{os.getpid()}.tmp")
+        tmp.unlink(missing_ok=True)  # left over from a crashed run with this pid
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(f"url: {CDS_URL}\nkey: {CDS_API_KEY}\n")
+            os.replace(tmp, cdsapi_rc)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
         print(f"✓ Created {cdsapi_rc}")
     return True
 
 
-def download_era5_climate(years: list, region: dict) -> pd.DataFrame:
-    """Download ERA5 climate data from Copernicus CDS.
+def _era5_netcdf_parts(path: Path) -> list:
+    """NetCDF files that make up one downloaded ERA5 year.
 
-    Downloads temperature and precipitation at daily resolution.
-    For 10 years, this may take 10-30 minutes depending on CDS queue.
+    CDS returns instantaneous (t2m) and accumulated (tp) variables as
+    separate NetCDF files inside a zip; those parts are extracted next to
+    the raw file.
     """
-    import cdsapi
-    import xarray as xr
+    if not zipfile.is_zipfile(path):
+        return [path]
+
+    parts_dir = path.with_name(f"{path.stem}_parts")
+    with zipfile.ZipFile(path) as zf:
+        names = [name for name in zf.namelist() if name.endswith(".nc")]
+        zf.extractall(parts_dir, members=names)
+    return [parts_dir / name for name in names]
+
+
+def _normalize_era5(ds):
+    """Newer CDS output names the time axis ``valid_time``; rename it to ``time``."""
+    if "valid_time" in ds.dims:
+        ds = ds.rename({"valid_time": "time"})
+    return ds
+
+
+def _open_era5_file(path: Path):
+    """Open one downloaded ERA5 year as a single xarray Dataset."""
+    _, xr = _cds_xr()
+
+    parts = [
+        xr.open_dataset(part, engine=ERA5_ENGINE, chunks=ERA5_CHUNKS)
+        for part in _era5_netcdf_parts(path)
+    ]
+    ds = parts[0] if len(parts) == 1 else xr.merge(parts, compat="override")
+    return _normalize_era5(ds)
+
+
+def _open_era5_years(paths: list):
+    """Open several downloaded ERA5 years as one dask-backed Dataset."""
+    _, xr = _cds_xr()
+
+    parts = [part for path in paths for part in _era5_netcdf_parts(path)]
+    return xr.open_mfdataset(
+        parts,
+        combine="by_coords",
+        parallel=True,
+        chunks=ERA5_CHUNKS,
+        engine=ERA5_ENGINE,
+        preprocess=_normalize_era5,
+        data_vars="minimal",
+        coords="minimal",
+        compat="no_conflicts",
+        join="outer",
+    )
 
-    setup_cds_credentials()
+
+def _reduce_era5(ds) -> pd.DataFrame:
+    """Reduce an ERA5 Dataset to daily regional means in °C and mm."""
+    # Both variables reduce in a single pass
+    reduced = ds[["t2m", "tp"]].mean(dim=["latitude", "longitude"]).compute()
+
+    # Convert K -> °C and m -> mm in place on the reduced arrays
+    temperature = reduced["t2m"].values
+    np.subtract(temperature, 273.15, out=temperature)
+    precipitation = reduced["tp"].values
+    np.multiply(precipitation, 1000.0, out=precipitation)
+
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(reduced.time.values),
+            "temperature_c": temperature,
+            "precipitation_mm": precipitation,
+        }
+    )
+
+
+def _snap_era5_area(area: list) -> list:
+    """Expand an [N, W, S, E] box outward to the native ERA5 grid.
+
+    Unaligned bounds make CDS interpolate server-side, which queues longer
+    and returns extra cells.
+    """
+    north, west, south, east = area
+    return [
+        math.ceil(north / ERA5_GRID) * ERA5_GRID,
+        math.floor(west / ERA5_GRID) * ERA5_GRID,
+        math.floor(south / ERA5_GRID) * ERA5_GRID,
+        math.ceil(east / ERA5_GRID) * ERA5_GRID,
+    ]
+
+
+def _era5_cache_dir(area: list) -> Path:
+    """Cache directory for one request area (results differ per area)."""
+    return CACHE_DIR / "_".join(f"{v:g}" for v in area)
+
+
+def _fetch_era5_year(year: str, area: list) -> Path:
+    """Download the raw NetCDF for one ERA5 year unless it is already cached.
+
+    Blocking; runs in a worker thread so several years can be in the CDS
+    queue at once.
+    """
+    raw_file = _era5_cache_dir(area) / f"era5_{year}.nc"
+    if raw_file.exists():
+        return raw_file
+
+    cdsapi, _ = _cds_xr()
+
+    # cdsapi clients are not safe to share across concurrent retrieves
     client = cdsapi.Client()
 
-    area = region["area"]  # [N, W, S, E]
+    # Download to a partial file so an interrupted year is never cached
+    part_file = raw_file.with_name(raw_file.name + ".part")
+    try:
+        client.retrieve(
+            "reanalysis-era5-single-levels",
+            {**ERA5_REQUEST, "year": year, "area": area},
+            str(part_file),
+        )
+        part_file.replace(raw_file)
+    finally:
+        if part_file.exists():
+            part_file.unlink()
 
-    all_data = []
+    return raw_file
 
-    print(f"\n📡 Downloading ERA5 data for {len(years)} years...")
-    print(f"   Region: {region['name']} ({area})")
-    print("   Note: Each year takes ~1-5 min depending on CDS queue\n")
 
-    for year in years:
-        print(f"   Downloading {year}...", end=" ", flush=True)
+async def _download_era5_years(years: list, area: list, concurrency: int) -> list:
+    """Download stage: fetch raw ERA5 years concurrently.
 
-        # Temporary file for this year
-        temp_file = DATA_DIR / f"era5_{year}_temp.grib"
+    Returns the years whose raw NetCDF is available, in request order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    fetched = set()
 
-        try:
-            client.retrieve(
-                "reanalysis-era5-single-levels",
-                {
-                    "product_type": "reanalysis",
-                    "variable": [
-                        "2m_temperature",
-                        "total_precipitation",
-                    ],
-                    "year": year,
-                    "month": [f"{m:02d}" for m in range(1, 13)],
-                    "day": [f"{d:02d}" for d in range(1, 32)],
-                    "time": ["12:00"],
-                    "area": area,
-                    "data_format": "grib",
-                },
-                str(temp_file),
-            )
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
 
-            # Process file
-            ds = None
-            for engine in ["cfgrib", "netcdf4", "scipy", "h5netcdf"]:
+        async def fetch(year: str):
+            async with semaphore:
                 try:
-                    ds = xr.open_dataset(temp_file, engine=engine)
-                    break
-                except Exception:
-                    continue
+                    await loop.run_in_executor(pool, _fetch_era5_year, year, area)
+                except Exception as e:
+                    logger.warning(f"{year}: ✗ Error: {e}")
+                    return
+            fetched.add(year)
+            logger.info(f"{year}: ✓ downloaded ({len(fetched)}/{len(years)})")
 
-            if ds is None:
-                raise RuntimeError(f"Could not open {temp_file}")
+        async with asyncio.TaskGroup() as tg:
+            for year in years:
+                tg.create_task(fetch(year))
+
+    return [year for year in years if year in fetched]
 
-            # Extract daily means
-            df_year = pd.DataFrame(
-                {
-                    "date": pd.to_datetime(ds.time.values),
-                    "temperature_c": ds["t2m"].mean(dim=["latitude", "longitude"]).values - 273.15,
-                    "precipitation_mm": ds["tp"].mean(dim=["latitude", "longitude"]).values * 1000,
-                }
-            )
 
-            all_data.append(df_year)
-            ds.close()
-            temp_file.unlink()
+def _process_era5_years(years: list, area: list, keep_raw: bool = True) -> dict:
+    """Process stage: reduce downloaded years to daily frames keyed by year.
 
-            print(f"✓ {len(df_year)} days")
+    With dask installed, all years are opened with xr.open_mfdataset and the
+    spatial mean runs as one parallel graph; otherwise (or if the combined
+    open fails) each year is opened on its own. Historical ERA5 data is
+    immutable, so every processed year is cached as Parquet under CACHE_DIR
+    and reruns skip both stages.
+    """
+    cache_dir = _era5_cache_dir(area)
+    raw_files = {year: cache_dir / f"era5_{year}.nc" for year in years}
+    frames = {}
 
+    if ERA5_CHUNKS is not None and len(years) > 1:
+        try:
+            with _open_era5_years(list(raw_files.values())) as ds:
+                climate_df = _reduce_era5(ds)
+            by_year = climate_df.groupby(climate_df["date"].dt.year.astype(str), sort=False)
+            frames = {
+                year: df_year.reset_index(drop=True)
+                for year, df_year in by_year
+                if year in raw_files
+            }
         except Exception as e:
-            print(f"✗ Error: {e}")
-            if temp_file.exists():
-                temp_file.unlink()
+            logger.warning(f"Combined open failed ({e}); processing years individually")
+
+    for year in years:
+        if year in frames:
             continue
+        try:
+            with _open_era5_file(raw_files[year]) as ds:
+                frames[year] = _reduce_era5(ds)
+        except Exception as e:
+            logger.warning(f"{year}: ✗ Error: {e}")
+
+    for year, df_year in frames.items():
+        if PYARROW_AVAILABLE:
+            df_year.to_parquet(cache_dir / f"era5_{year}.parquet", index=False)
+        if not keep_raw:
+            raw_file = raw_files[year]
+            raw_file.unlink()
+            shutil.rmtree(raw_file.with_name(f"{raw_file.stem}_parts"), ignore_errors=True)
+
+    return frames
+
+
+def download_era5_climate(
+    years: list, region: dict, concurrency: int = MAX_CDS_CONCURRENCY, keep_raw: bool = True
+) -> pd.DataFrame:
+    """Download ERA5 climate data from Copernicus CDS.
+
+    Downloads temperature and precipitation at daily resolution. Years are
+    requested concurrently (capped at MAX_CDS_CONCURRENCY to respect ECMWF
+    fair use), so wall time is roughly the total divided by the concurrency.
+    Downloaded years are then processed together (see _process_era5_years).
+    Completed years are cached under CACHE_DIR and are not downloaded again;
+    set keep_raw=False to delete the raw NetCDF once a year is processed.
+    """
+    concurrency = max(1, min(concurrency, MAX_CDS_CONCURRENCY))
+
+    # Fail fast on missing optional dependencies instead of once per year
+    _cds_xr()
+    setup_cds_credentials()
+
+    area = _snap_era5_area(region["area"])  # [N, W, S, E]
+    cache_dir = _era5_cache_dir(area)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"\n📡 Downloading ERA5 data for {len(years)} years...")
+    print(f"   Region: {region['name']} ({area})")
+    if area != list(region["area"]):
+        print(f"   Area snapped to {ERA5_GRID}° grid from {region['area']}")
+    print(f"   Concurrency: {concurrency} requests")
+    print("   Note: Each year takes ~1-5 min depending on CDS queue\n")
+
+    frames = {}
+    pending = []
+    for year in years:
+        cache_parquet = cache_dir / f"era5_{year}.parquet"
+        if PYARROW_AVAILABLE and cache_parquet.exists():
+            frames[year] = pd.read_parquet(cache_parquet)
+        else:
+            pending.append(year)
+    if frames:
+        logger.info(f"{len(frames)} years loaded from cache")
+
+    if pending:
+        downloaded = asyncio.run(_download_era5_years(pending, area, concurrency))
+        frames.update(_process_era5_years(downloaded, area, keep_raw))
+
+    all_data = [frames[year] for year in years if year in frames]
 
     if not all_data:
         raise RuntimeError("Failed to download any ERA5 data")
 
+    # Years come back in request order and each is date-sorted, so the global
+    # sort is normally a no-op; only pay for it when the frames are out of order.
     climate_df = pd.concat(all_data, ignore_index=True)
-    climate_df = climate_df.sort_values("date").reset_index(drop=True)
-    climate_df = climate_df.drop_duplicates(subset=["date"])
+    if not climate_df["date"].is_monotonic_increasing:
+        climate_df = climate_df.sort_values("date", kind="mergesort", ignore_index=True)
+    climate_df = climate_df.drop_duplicates(subset=["date"], keep="first", ignore_index=True)
 
     print(f"\n✓ Downloaded {len(climate_df)} days of climate data")
     print(f"  Period: {climate_df['date'].min().date()} to {climate_df['date'].max().date()}")
@@ -322,6 +569,64 @@ def download_era5_climate(years: list, region: dict) -> pd.DataFrame:
     return climate_df
 
 
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+
+def _write_csv_arrow(df: pd.DataFrame, csv_path: Path) -> None:
+    """Write a CSV with pyarrow's vectorized C++ writer, in DataFrame.to_csv's format.
+
+    Timestamps and booleans are formatted as pandas formats them, and nothing
+    is quoted; if a value would need quoting, pandas writes the file instead.
+    Floats keep Arrow's shortest round-trip form, which can differ from
+    pandas in notation only (0.00001 vs 1e-05).
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type) or pa.types.is_boolean(field.type):
+            col = df[field.name]
+            text = col.astype(str).where(col.notna(), None)
+            table = table.set_column(i, field.name, pa.array(text, type=pa.string()))
+
+    # Arrow quotes every header name, so the header is written as pandas would
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow(table.column_names)
+    try:
+        with open(csv_path, "wb") as f:
+            f.write(header.getvalue().encode())
+            pacsv.write_csv(
+                table, f, pacsv.WriteOptions(include_header=False, quoting_style="none")
+            )
+    except pa.ArrowInvalid:
+        df.to_csv(csv_path, index=False)
+
+
+def save_dataset(df: pd.DataFrame, csv_path: Path) -> Path:
+    """Save a dataset as CSV plus a Parquet copy alongside it.
+
+    The Parquet file (zstd-compressed, typed columns) is what the loaders
+    prefer; the CSV is kept for tools and tests that read it directly.
+    With pyarrow installed both are written by Arrow's C++ writers.
+
+    Args:
+        df: DataFrame to save
+        csv_path: Destination CSV path (Parquet uses the same stem)
+
+    Returns:
+        Path to the CSV file
+    """
+    if PYARROW_AVAILABLE:
+        _write_csv_arrow(df, csv_path)
+        df.to_parquet(
+            csv_path.with_suffix(".parquet"), engine="pyarrow", compression="zstd", index=False
+        )
+    else:
+        df.to_csv(csv_path, index=False)
+    return csv_path
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -329,6 +634,10 @@ def download_era5_climate(years: list, region: dict) -> pd.DataFrame:
 
 def main():
     """Run the USGS groundwater data download CLI."""
+    # Status lines from concurrent ERA5 workers go through logging, which
+    # writes each record whole instead of interleaving partial prints
+    logging.basicConfig(level=logging.INFO, format="   %(message)s")
+
     parser = argparse.ArgumentParser(
         description="Download real USGS groundwater & ERA5 climate data"
     )
@@ -361,6 +670,17 @@ def main():
         default=TIME_CONFIG["end_date"],
         help="End date (YYYY-MM-DD)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CDS_CONCURRENCY,
+        help=f"Concurrent ERA5 year downloads (max {MAX_CDS_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-cache-raw",
+        action="store_true",
+        help="Delete raw ERA5 NetCDF files after processing (processed years stay cached)",
+    )
     args = parser.parse_args()
 
     print("\n" + "=" * 60)
@@ -385,8 +705,7 @@ def main():
             start_date=args.start,
             end_date=args.end,
         )
-        gw_file = DATA_DIR / "groundwater.csv"
-        groundwater_df.to_csv(gw_file, index=False)
+        gw_file = save_dataset(groundwater_df, DATA_DIR / "groundwater.csv")
         print(f"\n💾 Saved: {gw_file}")
     except Exception as e:
         print(f"\n❌ Error downloading groundwater data: {e}")
@@ -397,9 +716,10 @@ def main():
         try:
             region = REGIONS[ACTIVE_REGION]
             years = TIME_CONFIG["years"]
-            climate_df = download_era5_climate(years, region)
-            climate_file = DATA_DIR / "climate.csv"
-            climate_df.to_csv(climate_file, index=False)
+            climate_df = download_era5_climate(
+                years, region, concurrency=args.concurrency, keep_raw=not args.no_cache_raw
+            )
+            climate_file = save_dataset(climate_df, DATA_DIR / "climate.csv")
             print(f"💾 Saved: {climate_file}")
         except Exception as e:
             print(f"\n⚠️ Climate download failed: {e}")
@@ -14,7 +14,8 @@ ROOT_DIR = Path(__file__).parent.parent.parent  # src/ui -> src -> root
 sys.path.insert(0, str(ROOT_DIR))
 sys.path.insert(0, str(ROOT_DIR / "src"))
 
-from agent import GroundwaterAgent, LLMProvider
+from agent import GroundwaterAgent, LLMProvider  # noqa: E402
+from agent.knowledge import get_knowledge_stats  # noqa: E402
 
 # Page configuration
 st.set_page_config(
@@ -48,6 +49,13 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _knowledge_stats() -> dict:
+    """Knowledge base statistics, refreshed at most once a minute."""
+    return get_knowledge_stats()
+
+
 # Title
 st.title("💧 GroundwaterGPT")
 st.markdown("*AI-powered groundwater research assistant for Fort Myers, FL*")
@@ -88,6 +96,7 @@ with st.sidebar:
     )
 
     # API key input for non-local providers
+    api_key = ""
     if provider != LLMProvider.OLLAMA:
         api_key_names = {
             LLMProvider.OPENAI: "OPENAI_API_KEY",
@@ -108,14 +117,11 @@ with st.sidebar:
     # Knowledge base info
     st.header("📚 Knowledge Base")
 
-    if "agent" in st.session_state:
-        kb_info = st.session_state.agent.get_knowledge_info()
-        st.metric("Document Chunks", kb_info.get("total_chunks", 0))
-        st.caption("Reference Documents:")
-        for pdf in kb_info.get("pdf_names", []):
-            st.caption(f"  • {pdf}")
-    else:
-        st.caption("Loading...")
+    kb_info = _knowledge_stats()
+    st.metric("Document Chunks", kb_info.get("total_chunks", 0))
+    st.caption("Reference Documents:")
+    for pdf in kb_info.get("pdf_names", []):
+        st.caption(f"  • {pdf}")
 
     st.divider()
 
@@ -145,80 +151,71 @@ with st.sidebar:
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-if "agent" not in st.session_state:
+# The agent holds this user's chat history, so it lives in session state and
+# is rebuilt only when the provider, model or API key changes. Building it is
+# cheap: get_llm memoizes the chat model shared by sessions with the same settings.
+agent_config = (provider, model, hash(api_key))
+if st.session_state.get("agent_config") != agent_config:
     with st.spinner("🔄 Initializing GroundwaterGPT..."):
         try:
-            st.session_state.agent = GroundwaterAgent(
-                provider=provider,
-                model=model,
-                verbose=False,
-            )
+            st.session_state.agent = GroundwaterAgent(provider=provider, model=model, verbose=False)
+            st.session_state.agent_config = agent_config
         except Exception as e:
             st.error(f"Failed to initialize agent: {str(e)}")
             st.stop()
 
-# Check if provider/model changed
-if (
-    st.session_state.get("current_provider") != provider
-    or st.session_state.get("current_model") != model
-):
-    with st.spinner("🔄 Switching model..."):
-        try:
-            st.session_state.agent = GroundwaterAgent(
-                provider=provider,
-                model=model,
-                verbose=False,
-            )
-            st.session_state.current_provider = provider
-            st.session_state.current_model = model
-        except Exception as e:
-            st.error(f"Failed to switch model: {str(e)}")
-
-# Suggested prompts
-if not st.session_state.messages:
-    st.markdown("### 👋 Welcome! Try asking:")
-
-    col1, col2, col3 = st.columns(3)
-
-    suggested_prompts = [
-        "What's the current groundwater level?",
-        "Show me seasonal patterns",
-        "Predict water levels for next week",
-        "Are there any anomalies in the data?",
-        "What is an aquifer?",
-        "Explain the data quality",
-    ]
 
-    for i, prompt in enumerate(suggested_prompts):
-        col = [col1, col2, col3][i % 3]
-        with col:
-            if st.button(prompt, key=f"suggest_{i}", use_container_width=True):
-                st.session_state.messages.append({"role": "user", "content": prompt})
-                st.rerun()
-
-# Display chat history
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
-
-# Chat input
-if prompt := st.chat_input("Ask about groundwater data, predictions, or hydrogeology..."):
-    # Add user message
-    st.session_state.messages.append({"role": "user", "content": prompt})
-    with st.chat_message("user"):
-        st.markdown(prompt)
-
-    # Get agent response
-    with st.chat_message("assistant"):
-        with st.spinner("🤔 Thinking..."):
-            try:
-                response = st.session_state.agent.chat(prompt)
-                st.markdown(response)
-                st.session_state.messages.append({"role": "assistant", "content": response})
-            except Exception as e:
-                error_msg = f"❌ Error: {str(e)}"
-                st.error(error_msg)
-                st.session_state.messages.append({"role": "assistant", "content": error_msg})
+@st.fragment
+def _render_chat():
+    """Chat area; sending a message reruns only this fragment, not the sidebar."""
+    # Suggested prompts
+    if not st.session_state.messages:
+        st.markdown("### 👋 Welcome! Try asking:")
+
+        col1, col2, col3 = st.columns(3)
+
+        suggested_prompts = [
+            "What's the current groundwater level?",
+            "Show me seasonal patterns",
+            "Predict water levels for next week",
+            "Are there any anomalies in the data?",
+            "What is an aquifer?",
+            "Explain the data quality",
+        ]
+
+        for i, prompt in enumerate(suggested_prompts):
+            col = [col1, col2, col3][i % 3]
+            with col:
+                if st.button(prompt, key=f"suggest_{i}", use_container_width=True):
+                    st.session_state.messages.append({"role": "user", "content": prompt})
+                    st.rerun()
+
+    # Display chat history
+    for message in st.session_state.messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+    # Chat input
+    if prompt := st.chat_input("Ask about groundwater data, predictions, or hydrogeology..."):
+        # Add user message
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
+
+        # Get agent response
+        with st.chat_message("assistant"):
+            with st.spinner("🤔 Thinking..."):
+                try:
+                    response = st.session_state.agent.chat(prompt)
+                    st.markdown(response)
+                    st.session_state.messages.append({"role": "assistant", "content": response})
+                except Exception as e:
+                    error_msg = f"❌ Error: {str(e)}"
+                    st.error(error_msg)
+                    st.session_state.messages.append({"role": "assistant", "content": error_msg})
+
+
+_render_chat()
 
 # Footer
 st.divider()
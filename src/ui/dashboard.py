@@ -10,7 +10,9 @@ Data Source: USGS NWIS (National Water Information System)
 Site: 262724081260701 - Lee County, FL (Fort Myers area)
 """
 
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -29,8 +31,17 @@ except ImportError:
 
 
 def load_groundwater_data() -> pd.DataFrame:
-    """Load groundwater data from USGS NWIS CSV."""
-    gw = pd.read_csv(DATA_DIR / "groundwater.csv", parse_dates=["date"])
+    """Load groundwater data from USGS NWIS, preferring the Parquet copy."""
+    csv_path = DATA_DIR / "groundwater.csv"
+    parquet_path = csv_path.with_suffix(".parquet")
+
+    # Parquet keeps the date dtype, so no date parsing is needed
+    if parquet_path.exists() and (
+        not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        gw = pd.read_parquet(parquet_path)
+    else:
+        gw = pd.read_csv(csv_path, parse_dates=["date"])
 
     # Keep data in feet (original USGS units)
     gw = gw.set_index("date").sort_index()
@@ -42,6 +53,50 @@ def load_groundwater_data() -> pd.DataFrame:
     return gw
 
 
+@dataclass(frozen=True)
+class TrendStats:
+    """Groundwater record with its linear trend, shared by dashboard and report."""
+
+    gw: pd.DataFrame
+    slope: float
+    intercept: float
+    annual_change_ft: float
+    total_change_ft: float
+
+
+def _data_cache_key() -> tuple:
+    """Build a cache key that changes whenever the groundwater data files change."""
+    paths = (DATA_DIR / "groundwater.csv", DATA_DIR / "groundwater.parquet")
+    return (str(DATA_DIR),) + tuple(p.stat().st_mtime if p.exists() else None for p in paths)
+
+
+@lru_cache(maxsize=1)
+def _trend_stats(cache_key: tuple) -> TrendStats:
+    """Load the data and fit the linear trend once per data-file version."""
+    gw = load_groundwater_data()
+
+    x = np.arange(len(gw))
+    mask = ~np.isnan(gw["water_level_ft"].values)
+    slope, intercept = np.polyfit(x[mask], gw["water_level_ft"].values[mask], 1)
+
+    return TrendStats(
+        gw=gw,
+        slope=float(slope),
+        intercept=float(intercept),
+        annual_change_ft=float(slope * 365),
+        total_change_ft=float(slope * len(gw)),
+    )
+
+
+def get_trend_stats() -> TrendStats:
+    """Get the (cached) groundwater data and trend statistics.
+
+    The cache is keyed on the data files' modification times, so a fresh
+    download is picked up automatically.
+    """
+    return _trend_stats(_data_cache_key())
+
+
 def create_dashboard() -> str:
     """Create comprehensive interactive HTML dashboard with 8 panels.
 
@@ -51,7 +106,8 @@ def create_dashboard() -> str:
         raise ImportError("plotly required. Install: pip install plotly")
 
     print("📊 Loading USGS groundwater data...")
-    gw = load_groundwater_data()
+    stats = get_trend_stats()
+    gw = stats.gw
 
     site_id = gw["site_id"].iloc[0] if "site_id" in gw.columns else "Unknown"
     start_date = gw.index.min()
@@ -67,13 +123,11 @@ def create_dashboard() -> str:
         f"   ✓ Water levels: {gw['water_level_ft'].min():.2f} to {gw['water_level_ft'].max():.2f} ft"
     )
 
-    # Calculate trend
+    # Trend line from the shared trend fit
     x = np.arange(len(gw))
-    mask = ~np.isnan(gw["water_level_ft"].values)
-    slope, intercept = np.polyfit(x[mask], gw["water_level_ft"].values[mask], 1)
-    trend_line = slope * x + intercept
-    annual_change_ft = slope * 365
-    total_change_ft = slope * len(gw)
+    trend_line = stats.slope * x + stats.intercept
+    annual_change_ft = stats.annual_change_ft
+    total_change_ft = stats.total_change_ft
 
     # Add calculated columns
     gw = gw.copy()
@@ -165,10 +219,18 @@ def create_dashboard() -> str:
     PURPLE = "#9467bd"
     CYAN = "#17becf"
 
+    # Traces are queued per panel and added to the figure in a single batch
+    traces, trace_rows, trace_cols = [], [], []
+
+    def queue_trace(trace, row, col):
+        traces.append(trace)
+        trace_rows.append(row)
+        trace_cols.append(col)
+
     # =========================================================================
     # Panel 1: Time Series with Multiple Averages
     # =========================================================================
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=gw.index,
             y=gw["water_level_ft"],
@@ -181,7 +243,7 @@ def create_dashboard() -> str:
         row=1,
         col=1,
     )
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=gw.index,
             y=gw["roll_30"],
@@ -193,7 +255,7 @@ def create_dashboard() -> str:
         row=1,
         col=1,
     )
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=gw.index,
             y=gw["roll_365"],
@@ -205,7 +267,7 @@ def create_dashboard() -> str:
         row=1,
         col=1,
     )
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=gw.index,
             y=gw["trend"],
@@ -221,7 +283,7 @@ def create_dashboard() -> str:
     # =========================================================================
     # Panel 2: Annual Statistics (Box-like bars)
     # =========================================================================
-    fig.add_trace(
+    queue_trace(
         go.Bar(
             x=yearly["year"],
             y=yearly["mean"],
@@ -234,7 +296,7 @@ def create_dashboard() -> str:
         col=2,
     )
     # Add min/max range as error bars
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=yearly["year"],
             y=yearly["min"],
@@ -246,7 +308,7 @@ def create_dashboard() -> str:
         row=1,
         col=2,
     )
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=yearly["year"],
             y=yearly["max"],
@@ -264,7 +326,7 @@ def create_dashboard() -> str:
     # =========================================================================
     # Dry season (Nov-May) vs Wet season (Jun-Oct) coloring
     season_colors = [ORANGE if m in [11, 12, 1, 2, 3, 4, 5] else BLUE for m in monthly["month"]]
-    fig.add_trace(
+    queue_trace(
         go.Bar(
             x=month_names,
             y=monthly["mean"],
@@ -276,25 +338,6 @@ def create_dashboard() -> str:
         row=2,
         col=1,
     )
-    # Add annotation for seasons
-    fig.add_annotation(
-        x=2.5,
-        y=monthly["mean"].max() + 1,
-        text="🌵 Dry Season",
-        showarrow=False,
-        font=dict(size=10, color=ORANGE),
-        row=2,
-        col=1,
-    )
-    fig.add_annotation(
-        x=7.5,
-        y=monthly["mean"].max() + 1,
-        text="🌧️ Wet Season",
-        showarrow=False,
-        font=dict(size=10, color=BLUE),
-        row=2,
-        col=1,
-    )
 
     # =========================================================================
     # Panel 4: Year-over-Year Comparison
@@ -311,9 +354,11 @@ def create_dashboard() -> str:
         "#bcbd22",
         "#17becf",
     ]
+    # One shared hover template; the year comes from each trace's name
+    yoy_hovertemplate = "%{fullData.name}<br>Day %{x}: %{y:.2f} ft<extra></extra>"
     for i, year in enumerate(sorted(gw["year"].unique())):
         year_data = gw[gw["year"] == year]
-        fig.add_trace(
+        queue_trace(
             go.Scatter(
                 x=year_data["day_of_year"],
                 y=year_data["water_level_ft"],
@@ -321,7 +366,7 @@ def create_dashboard() -> str:
                 name=str(year),
                 line=dict(color=year_colors[i % len(year_colors)], width=1.5),
                 opacity=0.8,
-                hovertemplate=f"{year}<br>Day %{{x}}: %{{y:.2f}} ft<extra></extra>",
+                hovertemplate=yoy_hovertemplate,
             ),
             row=2,
             col=2,
@@ -334,7 +379,7 @@ def create_dashboard() -> str:
     pos_mask = gw["anomaly"] >= 0
     neg_mask = gw["anomaly"] < 0
 
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=gw.index[pos_mask],
             y=gw["anomaly"][pos_mask],
@@ -347,7 +392,7 @@ def create_dashboard() -> str:
         row=3,
         col=1,
     )
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=gw.index[neg_mask],
             y=gw["anomaly"][neg_mask],
@@ -360,12 +405,11 @@ def create_dashboard() -> str:
         row=3,
         col=1,
     )
-    fig.add_hline(y=0, line_color="black", line_width=1, row=3, col=1)
 
     # =========================================================================
     # Panel 6: Rate of Change
     # =========================================================================
-    fig.add_trace(
+    queue_trace(
         go.Scatter(
             x=rate_dates,
             y=rates,
@@ -378,23 +422,12 @@ def create_dashboard() -> str:
         row=3,
         col=2,
     )
-    fig.add_hline(y=0, line_color="black", line_width=1, row=3, col=2)
-    # Add overall trend line
-    fig.add_hline(
-        y=annual_change_ft,
-        line_color=RED,
-        line_width=2,
-        line_dash="dash",
-        annotation_text=f"Overall: {annual_change_ft:.3f} ft/yr",
-        row=3,
-        col=2,
-    )
 
     # =========================================================================
     # Panel 7: Daily Changes Distribution
     # =========================================================================
     daily_changes = gw["daily_change"].dropna()
-    fig.add_trace(
+    queue_trace(
         go.Histogram(
             x=daily_changes,
             nbinsx=100,
@@ -405,16 +438,6 @@ def create_dashboard() -> str:
         row=4,
         col=1,
     )
-    fig.add_vline(x=0, line_color="black", line_width=2, row=4, col=1)
-    fig.add_vline(
-        x=daily_changes.mean(),
-        line_color=RED,
-        line_width=2,
-        line_dash="dash",
-        annotation_text=f"Mean: {daily_changes.mean():.3f}",
-        row=4,
-        col=1,
-    )
 
     # =========================================================================
     # Panel 8: Data Coverage by Year
@@ -423,7 +446,7 @@ def create_dashboard() -> str:
     coverage["expected"] = 365
     coverage["pct"] = (coverage["count"] / coverage["expected"] * 100).clip(upper=100)
 
-    fig.add_trace(
+    queue_trace(
         go.Bar(
             x=coverage["year"],
             y=coverage["count"],
@@ -437,6 +460,56 @@ def create_dashboard() -> str:
         row=4,
         col=2,
     )
+
+    fig.add_traces(traces, rows=trace_rows, cols=trace_cols)
+
+    # =========================================================================
+    # Reference Lines & Annotations
+    # =========================================================================
+    # Added after the traces so subplot-scoped shapes land on non-empty panels
+    # Panel 3: season labels
+    fig.add_annotation(
+        x=2.5,
+        y=monthly["mean"].max() + 1,
+        text="🌵 Dry Season",
+        showarrow=False,
+        font=dict(size=10, color=ORANGE),
+        row=2,
+        col=1,
+    )
+    fig.add_annotation(
+        x=7.5,
+        y=monthly["mean"].max() + 1,
+        text="🌧️ Wet Season",
+        showarrow=False,
+        font=dict(size=10, color=BLUE),
+        row=2,
+        col=1,
+    )
+    # Panels 5 & 6: zero lines and overall trend
+    fig.add_hline(y=0, line_color="black", line_width=1, row=3, col=1)
+    fig.add_hline(y=0, line_color="black", line_width=1, row=3, col=2)
+    fig.add_hline(
+        y=annual_change_ft,
+        line_color=RED,
+        line_width=2,
+        line_dash="dash",
+        annotation_text=f"Overall: {annual_change_ft:.3f} ft/yr",
+        row=3,
+        col=2,
+    )
+    # Panel 7: zero and mean daily change
+    fig.add_vline(x=0, line_color="black", line_width=2, row=4, col=1)
+    fig.add_vline(
+        x=daily_changes.mean(),
+        line_color=RED,
+        line_width=2,
+        line_dash="dash",
+        annotation_text=f"Mean: {daily_changes.mean():.3f}",
+        row=4,
+        col=1,
+    )
+    # Panel 8: full-year reference
     fig.add_hline(
         y=365,
         line_color="black",
@@ -474,6 +547,7 @@ def create_dashboard() -> str:
         showlegend=False,
         template="plotly_white",
         margin=dict(t=120, b=60, l=70, r=70),
+        uirevision="dashboard",
     )
 
     # Y-axis labels
@@ -507,13 +581,10 @@ def create_dashboard() -> str:
 
 def generate_trend_report() -> str:
     """Generate text report on groundwater trends using real USGS data."""
-    gw = load_groundwater_data()
-
-    x = np.arange(len(gw))
-    mask = ~np.isnan(gw["water_level_ft"].values)
-    slope, intercept = np.polyfit(x[mask], gw["water_level_ft"].values[mask], 1)
-    annual_change = slope * 365
-    total_change = slope * len(gw)
+    stats = get_trend_stats()
+    gw = stats.gw
+    annual_change = stats.annual_change_ft
+    total_change = stats.total_change_ft
 
     gw = gw.copy()
     gw["month"] = gw.index.month
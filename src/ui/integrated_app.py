@@ -295,32 +295,31 @@ def query_knowledge_base(query: str, num_results: int = 10) -> dict:
     """Query the knowledge base directly for fast results."""
     results = search_knowledge(query, k=num_results, score_threshold=0.2)
 
-    usgs_results = []
-    pdf_results = []
-    other_results = []
+    buckets = {
+        "usgs_groundwater_data": [],
+        "hydrogeology_reference": [],
+        "_other": [],
+    }
+    other_results = buckets["_other"]
 
     for doc in results:
-        doc_type = doc.metadata.get("doc_type", "unknown")
-        result_item = {
-            "content": doc.page_content,
-            "doc_type": doc_type,
-            "source": doc.metadata.get("source_file", doc.metadata.get("site_name", "Unknown")),
-            "metadata": doc.metadata,
-            "similarity": doc.metadata.get("similarity_score", 0),
-        }
-
-        if doc_type == "usgs_groundwater_data":
-            usgs_results.append(result_item)
-        elif doc_type == "hydrogeology_reference":
-            pdf_results.append(result_item)
-        else:
-            other_results.append(result_item)
+        meta = doc.metadata
+        doc_type = meta.get("doc_type", "unknown")
+        buckets.get(doc_type, other_results).append(
+            {
+                "content": doc.page_content,
+                "doc_type": doc_type,
+                "source": meta.get("source_file", meta.get("site_name", "Unknown")),
+                "metadata": meta,
+                "similarity": meta.get("similarity_score", 0),
+            }
+        )
 
     return {
         "query": query,
         "total_results": len(results),
-        "usgs_data": usgs_results,
-        "pdf_references": pdf_results,
+        "usgs_data": buckets["usgs_groundwater_data"],
+        "pdf_references": buckets["hydrogeology_reference"],
         "other": other_results,
         "timestamp": datetime.now().isoformat(),
     }
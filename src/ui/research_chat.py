@@ -28,6 +28,7 @@ Usage:
 import logging
 import sys
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 # Add parent directories to path for imports
@@ -44,6 +45,9 @@ from src.agent.research_agent import DeepResearchAgent
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Max USGS results rendered as expanders before "Load more"
+MAX_RENDERED = 10
+
 # Page configuration
 st.set_page_config(
     page_title="GroundwaterGPT Research",
@@ -105,6 +109,8 @@ if "current_research" not in st.session_state:
     st.session_state.current_research = None
 if "current_query_results" not in st.session_state:
     st.session_state.current_query_results = None
+if "show_all_usgs" not in st.session_state:
+    st.session_state.show_all_usgs = False
 if "is_researching" not in st.session_state:
     st.session_state.is_researching = False
 if "research_status" not in st.session_state:
@@ -118,7 +124,11 @@ def initialize_agent(
     auto_learn: bool = True,
     min_confidence: float = 0.7,
 ):
-    """Initialize the Deep Research Agent."""
+    """Initialize the Deep Research Agent for this session.
+
+    The agent tracks its active run (stop/status), so each session keeps its
+    own in session state; the LLM client it uses is shared (see get_llm).
+    """
     st.session_state.agent = DeepResearchAgent(
         max_depth=max_depth,
         use_web_search=use_web,
@@ -135,6 +145,7 @@ def stop_research():
         st.session_state.research_status = "stopping..."
 
 
+@st.cache_data(show_spinner=False, ttl=300, max_entries=128)
 def query_knowledge_base(query: str, num_results: int = 10) -> dict:
     """Query the knowledge base directly for fast results.
     
@@ -147,38 +158,41 @@ def query_knowledge_base(query: str, num_results: int = 10) -> dict:
     """
     results = search_knowledge(query, k=num_results, score_threshold=0.2)
     
-    # Organize results by type
-    usgs_results = []
-    pdf_results = []
-    other_results = []
+    # Organize results by type: one dict lookup per doc, unknown types go to '_other'
+    buckets = {
+        'usgs_groundwater_data': [],
+        'hydrogeology_reference': [],
+        '_other': [],
+    }
+    other_results = buckets['_other']
     
     for doc in results:
-        doc_type = doc.metadata.get('doc_type', 'unknown')
-        result_item = {
+        meta = doc.metadata
+        doc_type = meta.get('doc_type', 'unknown')
+        buckets.get(doc_type, other_results).append({
             'content': doc.page_content,
             'doc_type': doc_type,
-            'source': doc.metadata.get('source_file', doc.metadata.get('site_name', 'Unknown')),
-            'metadata': doc.metadata,
-            'similarity': doc.metadata.get('similarity_score', 0)
-        }
-        
-        if doc_type == 'usgs_groundwater_data':
-            usgs_results.append(result_item)
-        elif doc_type == 'hydrogeology_reference':
-            pdf_results.append(result_item)
-        else:
-            other_results.append(result_item)
+            'source': meta.get('source_file', meta.get('site_name', 'Unknown')),
+            'metadata': meta,
+            'similarity': meta.get('similarity_score', 0)
+        })
     
     return {
         'query': query,
         'total_results': len(results),
-        'usgs_data': usgs_results,
-        'pdf_references': pdf_results,
+        'usgs_data': buckets['usgs_groundwater_data'],
+        'pdf_references': buckets['hydrogeology_reference'],
         'other': other_results,
         'timestamp': datetime.now().isoformat()
     }
 
 
+@st.cache_data(show_spinner=False, ttl=60)
+def _knowledge_stats() -> dict:
+    """Knowledge base statistics, refreshed at most once a minute."""
+    return get_knowledge_stats()
+
+
 def display_query_results(results: dict):
     """Display knowledge base query results."""
     st.markdown("---")
@@ -189,16 +203,24 @@ def display_query_results(results: dict):
     usgs_data = results.get('usgs_data', [])
     if usgs_data:
         st.markdown("#### 📊 USGS Groundwater Data")
-        for i, item in enumerate(usgs_data, 1):
+        limit = None if st.session_state.show_all_usgs else MAX_RENDERED
+        for i, item in enumerate(islice(usgs_data, limit), 1):
             with st.expander(f"📍 {item['source']}", expanded=(i <= 2)):
                 st.markdown(item['content'])
                 st.caption(f"Similarity: {item['similarity']:.2%}")
+        
+        hidden = len(usgs_data) - MAX_RENDERED
+        if limit is not None and hidden > 0:
+            st.caption(f"+{hidden} more USGS results")
+            if st.button("Load more", key="load_more_usgs"):
+                st.session_state.show_all_usgs = True
+                st.rerun()
     
     # PDF Reference Results
     pdf_refs = results.get('pdf_references', [])
     if pdf_refs:
         st.markdown("#### 📖 Hydrogeology References")
-        for i, item in enumerate(pdf_refs[:5], 1):
+        for item in islice(pdf_refs, 5):
             with st.expander(f"📄 {item['source']}", expanded=False):
                 st.markdown(item['content'])
                 st.caption(f"Similarity: {item['similarity']:.2%}")
@@ -207,7 +229,7 @@ def display_query_results(results: dict):
     other = results.get('other', [])
     if other:
         st.markdown("#### 🔍 Other Sources")
-        for item in other[:3]:
+        for item in islice(other, 3):
             with st.expander(f"📝 {item['source']}", expanded=False):
                 st.markdown(item['content'])
     
@@ -298,7 +320,7 @@ def main():
 
     # Knowledge base stats
     try:
-        kb_stats = get_knowledge_stats()
+        kb_stats = _knowledge_stats()
         st.sidebar.markdown("### 📚 Knowledge Base")
         st.sidebar.info(
             f"""
@@ -415,6 +437,7 @@ def main():
             with st.spinner("Searching knowledge base..."):
                 results = query_knowledge_base(query, num_results=num_results)
                 st.session_state.current_query_results = results
+                st.session_state.show_all_usgs = False
             
             if results['total_results'] > 0:
                 st.success(f"✅ Found {results['total_results']} results!")
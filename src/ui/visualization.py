@@ -167,6 +167,40 @@ def calculate_statistics(df: pd.DataFrame) -> dict:
     }
 
 
+def _reversed_yaxis_range(*values, pad_frac: float = 0.05) -> list | None:
+    """Compute an explicit reversed y-axis range ``[max, min]`` for depth plots.
+
+    Passing a fixed range lets Plotly skip its client-side autorange scan
+    over every point of every trace.
+
+    Args:
+        *values: Arrays/Series whose combined extent the axis must cover
+        pad_frac: Fraction of the data span added as padding on each side
+
+    Returns:
+        ``[max, min]`` (reversed) or None if there are no finite values
+    """
+    arrays = [np.asarray(v, dtype=float).ravel() for v in values]
+    combined = np.concatenate(arrays) if arrays else np.array([])
+    combined = combined[np.isfinite(combined)]
+    if combined.size == 0:
+        return None
+
+    ymin = float(combined.min())
+    ymax = float(combined.max())
+    pad = (ymax - ymin) * pad_frac or 1.0
+    return [ymax + pad, ymin - pad]
+
+
+def _set_reversed_yaxis(fig: go.Figure, *values) -> None:
+    """Reverse the y-axis using a precomputed range, falling back to autorange."""
+    y_range = _reversed_yaxis_range(*values)
+    if y_range is None:
+        fig.update_yaxes(autorange="reversed")
+    else:
+        fig.update_yaxes(range=y_range)
+
+
 def create_time_series_plot(
     df: pd.DataFrame, site_info: dict, show_trend: bool = True, show_rolling_avg: bool = True
 ) -> go.Figure:
@@ -237,7 +271,7 @@ def create_time_series_plot(
     )
 
     # Note: Lower values = higher water table
-    fig.update_yaxes(autorange="reversed")
+    _set_reversed_yaxis(fig, df["water_level_ft"])
 
     return fig
 
@@ -312,7 +346,13 @@ def create_seasonal_plot(df: pd.DataFrame, site_info: dict) -> go.Figure:
         ],
     )
 
-    fig.update_yaxes(autorange="reversed")
+    # Bars start at zero and annotations sit above the tallest bar
+    _set_reversed_yaxis(
+        fig,
+        [0.0, monthly["mean"].max() + 1],
+        monthly["mean"] + monthly["std"].fillna(0),
+        monthly["mean"] - monthly["std"].fillna(0),
+    )
 
     return fig
 
@@ -339,6 +379,8 @@ def create_annual_comparison_plot(df: pd.DataFrame, site_info: dict) -> go.Figur
     n_years = len(years)
     colors = px.colors.sequential.Blues[3:] if n_years <= 6 else px.colors.sequential.Blues
 
+    # One shared hover template; the year comes from each trace's name
+    hovertemplate = "%{fullData.name}<br>Day %{x}<br>Level: %{y:.2f} ft<extra></extra>"
     for i, year in enumerate(years):
         year_data = df[df["year"] == year]
         color_idx = min(i, len(colors) - 1)
@@ -350,7 +392,7 @@ def create_annual_comparison_plot(df: pd.DataFrame, site_info: dict) -> go.Figur
                 name=str(year),
                 line=dict(width=2 if year == years[-1] else 1),
                 opacity=0.5 + (i / n_years) * 0.5,
-                hovertemplate=f"{year}<br>Day %{{x}}<br>Level: %{{y:.2f}} ft<extra></extra>",
+                hovertemplate=hovertemplate,
             )
         )
 
@@ -365,7 +407,7 @@ def create_annual_comparison_plot(df: pd.DataFrame, site_info: dict) -> go.Figur
         ),
     )
 
-    fig.update_yaxes(autorange="reversed")
+    _set_reversed_yaxis(fig, df["water_level_ft"])
 
     return fig
 
@@ -380,6 +422,7 @@ def create_multi_site_comparison(all_data: dict) -> go.Figure:
         Plotly figure
     """
     fig = go.Figure()
+    plotted = []
 
     for site_id, df in all_data.items():
         site_info = FLORIDA_SITES.get(site_id, {"name": site_id})
@@ -390,6 +433,7 @@ def create_multi_site_comparison(all_data: dict) -> go.Figure:
             y_data = df["roll_30"]
         else:
             y_data = df["water_level_ft"]
+        plotted.append(y_data)
 
         fig.add_trace(
             go.Scatter(
@@ -410,7 +454,7 @@ def create_multi_site_comparison(all_data: dict) -> go.Figure:
         legend=dict(yanchor="top", y=0.99, xanchor="left", x=1.02),
     )
 
-    fig.update_yaxes(autorange="reversed")
+    _set_reversed_yaxis(fig, *plotted)
 
     return fig
 
@@ -0,0 +1,77 @@
+"""Tests for GroundwaterAgent.stream with a ReAct agent.
+
+A stub graph stands in for LangGraph: like stream_mode="values", every chunk
+carries the whole message list, starting with the input messages.
+"""
+
+import sys
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# The agent module imports the knowledge base, which needs the vector store stack
+pytest.importorskip("langchain_chroma")
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage  # noqa: E402
+
+from agent.groundwater_agent import GroundwaterAgent  # noqa: E402
+
+
+class StubGraph:
+    """Replays message states after the input, like LangGraph's values stream."""
+
+    def __init__(self, *new_states):
+        self.new_states = new_states
+        self.stream_mode = None
+
+    def stream(self, inputs, stream_mode=None):
+        self.stream_mode = stream_mode
+        for new_messages in self.new_states:
+            yield {"messages": list(inputs["messages"]) + list(new_messages)}
+
+
+def make_agent(graph, history=()):
+    agent = GroundwaterAgent.__new__(GroundwaterAgent)
+    agent.use_react = True
+    agent.agent = graph
+    agent.chat_history = deque(history, maxlen=20)
+    return agent
+
+
+class TestReactStream:
+    def test_previous_answer_is_not_replayed(self):
+        history = [HumanMessage(content="first?"), AIMessage(content="old answer")]
+        graph = StubGraph(
+            [AIMessage(content="New", id="a1")],
+            [AIMessage(content="New answer", id="a1")],
+        )
+        agent = make_agent(graph, history)
+
+        chunks = list(agent.stream("second?"))
+
+        assert chunks == ["New", " answer"]
+        assert graph.stream_mode == "values"
+        assert agent.chat_history[-1].content == "New answer"
+
+    def test_two_ai_messages_do_not_repeat(self):
+        history = [HumanMessage(content="first?"), AIMessage(content="old answer")]
+        thinking = AIMessage(content="Let me check the data.", id="a1")
+        tool = ToolMessage(content="5.2 ft", tool_call_id="t1")
+        graph = StubGraph(
+            [thinking],
+            [thinking, tool],
+            [thinking, tool, AIMessage(content="The level is", id="a2")],
+            [thinking, tool, AIMessage(content="The level is 5.2 ft.", id="a2")],
+        )
+        agent = make_agent(graph, history)
+
+        chunks = list(agent.stream("level?"))
+
+        assert chunks == ["Let me check the data.", "The level is", " 5.2 ft."]
+        assert "old answer" not in "".join(chunks)
+        assert [m.content for m in agent.chat_history][-2:] == ["level?", "The level is 5.2 ft."]
@@ -0,0 +1,292 @@
+"""Tests for DeepResearchAgent run bookkeeping and its helpers."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+# The agent module imports the knowledge base, which needs the vector store stack
+pytest.importorskip("langchain_chroma")
+
+from agent.research_agent import (  # noqa: E402
+    DeepResearchAgent,
+    LLMResponseCache,
+    ResearchContext,
+    SearchResult,
+    SemanticCacheTable,
+    _dedupe_snippets,
+    _url_key,
+)
+
+
+class StubResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class StubLLM:
+    """Answers prompts with canned responses, in order, and records the prompts."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        return StubResponse(self.responses.pop(0))
+
+
+def make_agent(**attrs):
+    """An agent without LLM or search clients; tests set what they use."""
+    agent = DeepResearchAgent.__new__(DeepResearchAgent)
+    agent.max_depth = 3
+    agent.timeout_seconds = 60.0
+    agent.auto_learn = False
+    agent._active_contexts = {}
+    agent._research_lock = threading.Lock()
+    agent._llm_cache = None
+    for name, value in attrs.items():
+        setattr(agent, name, value)
+    return agent
+
+
+class TestConcurrentRuns:
+    """Several research_async calls can share one agent and event loop."""
+
+    def test_finished_run_does_not_clear_another(self):
+        agent = make_agent()
+        release = {}
+
+        async def research_graph(context):
+            release[context.original_query] = asyncio.Event()
+            await release[context.original_query].wait()
+
+        async def synthesize(context):
+            return "report"
+
+        agent._research_graph = research_graph
+        agent._synthesize_report = synthesize
+
+        async def scenario():
+            first = asyncio.create_task(agent.research_async("first"))
+            second = asyncio.create_task(agent.research_async("second"))
+            await asyncio.sleep(0)
+            assert len(agent._active_contexts) == 2
+
+            release["first"].set()
+            await first
+            assert agent.is_running()
+            assert agent.get_status()["running"]
+
+            assert agent.stop()
+            release["second"].set()
+            return await second
+
+        result = asyncio.run(scenario())
+
+        assert result["stopped"]
+        assert not agent.is_running()
+        assert agent.get_status() == {"running": False, "status": "idle"}
+
+
+def unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class TestSemanticCacheTable:
+    """Near-miss cache of query-planning responses."""
+
+    def test_match_from_another_session_at_same_depth(self):
+        table = SemanticCacheTable(capacity=4)
+        table.add(unit(1, 0), "cached", depth=1, session=1)
+
+        response, score = table.lookup(unit(1, 0.05), depth=1, session=2)
+
+        assert response == "cached"
+        assert score > 0.99
+
+    def test_own_session_is_skipped(self):
+        table = SemanticCacheTable(capacity=4)
+        table.add(unit(1, 0), "cached", depth=1, session=1)
+
+        assert table.lookup(unit(1, 0), depth=1, session=1) is None
+
+    def test_other_depth_is_skipped(self):
+        table = SemanticCacheTable(capacity=4)
+        table.add(unit(1, 0), "depth one", depth=1, session=1)
+        table.add(unit(0.9, 0.1), "depth two", depth=2, session=1)
+
+        response, _ = table.lookup(unit(1, 0), depth=2, session=2)
+
+        assert response == "depth two"
+
+    def test_oldest_entry_is_overwritten_when_full(self):
+        table = SemanticCacheTable(capacity=2)
+        table.add(unit(1, 0), "first", depth=1, session=1)
+        table.add(unit(0, 1), "second", depth=1, session=1)
+        table.add(unit(-1, 0), "third", depth=1, session=1)
+
+        assert len(table) == 2
+        assert table.vectors.shape == (2, 2)
+        assert table.lookup(unit(1, 0), depth=1, session=2)[0] != "first"
+        assert table.lookup(unit(-1, 0), depth=1, session=2)[0] == "third"
+
+
+KB_RESULT = SearchResult(
+    title="Knowledge Base",
+    url="local://knowledge_base",
+    snippet="The Biscayne Aquifer is a shallow unconfined aquifer.",
+    source="knowledge_base",
+)
+
+
+class TestExtractAndFollowUp:
+    """Insights and follow-up queries come back from one LLM call."""
+
+    @staticmethod
+    def run(agent, depth=1, max_depth=3):
+        async def semantic_invoke(kind, context, prompt):
+            return await agent._ainvoke(prompt)
+
+        agent._semantic_invoke = semantic_invoke
+        context = ResearchContext(original_query="Biscayne Aquifer levels", max_depth=max_depth)
+        context.current_depth = depth
+        return asyncio.run(agent._extract_and_follow_up([KB_RESULT], context))
+
+    def test_follow_ups_after_marker(self):
+        llm = StubLLM(
+            "INSIGHT: Levels are falling\nCONFIDENCE: 0.8\nSOURCE: Knowledge Base\n\n"
+            "FOLLOW_UPS:\n1. Biscayne Aquifer saltwater intrusion\n2. Miami-Dade wells"
+        )
+        insights, follow_ups = self.run(make_agent(llm=llm))
+
+        assert [i.content for i in insights] == ["Levels are falling"]
+        assert follow_ups == ["Biscayne Aquifer saltwater intrusion", "Miami-Dade wells"]
+        assert len(llm.prompts) == 1
+
+    def test_follow_up_heading_variant(self):
+        llm = StubLLM(
+            "INSIGHT: Levels are falling\nCONFIDENCE: 0.8\n\n"
+            "**Follow-up queries:**\n1. Biscayne Aquifer recharge"
+        )
+        insights, follow_ups = self.run(make_agent(llm=llm))
+
+        assert len(insights) == 1
+        assert follow_ups == ["Biscayne Aquifer recharge"]
+        assert len(llm.prompts) == 1
+
+    def test_missing_marker_requests_follow_ups(self):
+        llm = StubLLM(
+            "INSIGHT: Levels are falling\nCONFIDENCE: 0.8\n\n1. Biscayne Aquifer recharge",
+            "1. Biscayne Aquifer recharge rates",
+        )
+        insights, follow_ups = self.run(make_agent(llm=llm))
+
+        assert [i.content for i in insights] == ["Levels are falling"]
+        assert follow_ups == ["Biscayne Aquifer recharge rates"]
+        assert len(llm.prompts) == 2
+
+    def test_no_follow_ups_at_max_depth(self):
+        llm = StubLLM("INSIGHT: Levels are falling\nCONFIDENCE: 0.8")
+        insights, follow_ups = self.run(make_agent(llm=llm), depth=3, max_depth=3)
+
+        assert len(insights) == 1
+        assert follow_ups == []
+        assert len(llm.prompts) == 1
+
+
+class TestParseFollowUps:
+    def setup_method(self):
+        self.agent = make_agent()
+        self.context = ResearchContext(original_query="q")
+
+    def test_numbering_is_stripped(self):
+        response = "1. first query\n2) second query\n3 - third query"
+        assert self.agent._parse_follow_ups(response, self.context) == [
+            "first query",
+            "second query",
+        ]
+
+    def test_complete_means_no_follow_ups(self):
+        assert self.agent._parse_follow_ups(" COMPLETE", self.context) == []
+
+    def test_previous_searches_are_skipped(self):
+        self.context.add_search("first query")
+        response = "1. first query\n2. second query"
+        assert self.agent._parse_follow_ups(response, self.context) == ["second query"]
+
+    def test_unnumbered_lines_are_ignored(self):
+        response = "Here are some ideas:\n1. first query"
+        assert self.agent._parse_follow_ups(response, self.context) == ["first query"]
+
+
+def snippet_result(snippet, url="https://www.usgs.gov/a"):
+    return SearchResult(title="USGS", url=url, snippet=snippet)
+
+
+class TestDedupeSnippets:
+    def test_near_duplicate_snippet_is_dropped(self):
+        text = "The Floridan Aquifer supplies drinking water to ten million people in Florida."
+        results = [snippet_result(text), snippet_result(text + " ", url="https://b.gov")]
+
+        kept = _dedupe_snippets(results)
+
+        assert [r.url for r, _ in kept] == ["https://www.usgs.gov/a"]
+
+    def test_repeated_sentence_is_removed(self):
+        shared = "Water levels are measured monthly."
+        results = [
+            snippet_result(f"Site G-3764 is in Miami-Dade. {shared}"),
+            snippet_result(f"{shared} Site G-1251 is near the coast.", url="https://b.gov"),
+        ]
+
+        kept = _dedupe_snippets(results)
+
+        assert [snippet for _, snippet in kept] == [
+            f"Site G-3764 is in Miami-Dade. {shared}",
+            "Site G-1251 is near the coast.",
+        ]
+
+
+class TestUrlKey:
+    def test_scheme_and_host_case_and_fragment_are_ignored(self):
+        assert _url_key("https://WaterData.USGS.gov/nwis/uv?site_no=1#top") == _url_key(
+            "HTTPS://waterdata.usgs.gov/nwis/uv?site_no=1"
+        )
+
+    def test_query_selects_a_different_page(self):
+        assert _url_key("https://waterdata.usgs.gov/nwis/uv?site_no=1") != _url_key(
+            "https://waterdata.usgs.gov/nwis/uv?site_no=2"
+        )
+
+    def test_path_case_is_kept(self):
+        assert _url_key("https://example.gov/Report.pdf") != _url_key(
+            "https://example.gov/report.pdf"
+        )
+
+
+class TestLLMResponseCache:
+    def test_entry_expires_after_ttl(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cache = LLMResponseCache(tmp_path / "llm.sqlite3", ttl_seconds=60)
+        key = LLMResponseCache.make_key("model", "prompt")
+
+        cache.set(key, "answer")
+        now[0] += 59
+        assert cache.get(key) == "answer"
+
+        now[0] += 2
+        assert cache.get(key) is None
+
+    def test_key_depends_on_model(self):
+        assert LLMResponseCache.make_key("a", "prompt") != LLMResponseCache.make_key("b", "prompt")
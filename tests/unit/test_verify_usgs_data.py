@@ -0,0 +1,64 @@
+"""Tests for the numeric token matching in scripts/verify_usgs_data.py."""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+# The script imports the knowledge base module, which needs the vector store stack
+pytest.importorskip("langchain_chroma")
+
+import verify_usgs_data  # noqa: E402
+from verify_usgs_data import _NUMBER_RE  # noqa: E402
+
+
+class TestNumberTokens:
+    """KB text is tokenised into numbers to compare against CSV statistics."""
+
+    def test_year_range_is_two_positive_years(self):
+        assert _NUMBER_RE.findall("Data Period: 2014-2023") == ["2014", "2023"]
+
+    def test_hyphenated_site_id_is_positive(self):
+        assert _NUMBER_RE.findall("USGS-02290000") == ["02290000"]
+
+    def test_hyphenated_well_name_is_positive(self):
+        assert _NUMBER_RE.findall("Miami-Dade G-3764") == ["3764"]
+
+    def test_standalone_negative_value_keeps_sign(self):
+        assert _NUMBER_RE.findall("Mean Water Level: -3.50 ft") == ["-3.50"]
+
+    def test_decimal_range(self):
+        assert _NUMBER_RE.findall("between 12.5-13.0 ft") == ["12.5", "13.0"]
+
+
+class TestVerifySite:
+    """CSV statistics are compared against the site's KB summary."""
+
+    @pytest.fixture(autouse=True)
+    def no_kb(self, monkeypatch):
+        monkeypatch.setattr(verify_usgs_data, "search_usgs_data", lambda **kwargs: [])
+
+    @pytest.mark.parametrize("values", ["", "nan"], ids=["empty", "all-nan"])
+    def test_site_without_values_gives_nan_stats(self, tmp_path, values):
+        csv_file = tmp_path / "usgs_site.csv"
+        csv_file.write_text(f"site_no,value\n251241080385301,{values}\n")
+
+        result = verify_usgs_data.verify_site(str(csv_file), f"Empty site {values!r}")
+
+        stats = result["csv_stats"]
+        assert all(math.isnan(stats[key]) for key in ("mean", "min", "max"))
+        assert stats["records"] == 1
+        assert not result["all_match"]
+
+    def test_csv_without_rows(self, tmp_path):
+        csv_file = tmp_path / "usgs_site.csv"
+        csv_file.write_text("site_no,value\n")
+
+        result = verify_usgs_data.verify_site(str(csv_file), "Site with no rows")
+
+        assert result["csv_stats"]["records"] == 0
+        assert math.isnan(result["csv_stats"]["mean"])